@@ -95,7 +95,7 @@ class _SeqCCompileItem:
 class _UploadItem:
     seqc_item: _SeqCCompileItem | None
     waves: Waveforms | None
-    command_table: dict[Any] | None
+    command_table: dict[Any] | str | None
 
 
 class Controller:
@@ -23,10 +23,8 @@ from laboneq.controller.devices.device_zi import DeviceZI
 from laboneq.controller.devices.zi_node_monitor import (
     ConditionsChecker,
     NodeControlBase,
+    NodeControlSet,
     ResponseWaiter,
-    filter_commands,
-    filter_conditions,
-    filter_responses,
 )
 from laboneq.controller.util import LabOneQControllerException
 from laboneq.core.types.enums.reference_clock_source import ReferenceClockSource
@@ -115,10 +113,11 @@ class DeviceCollection:
         for device in devices:
             dev_nodes = control_nodes_getter(device)
 
+            node_set = NodeControlSet.from_nodes(dev_nodes)
             conditions_checker = ConditionsChecker()
             conditions_checker.add(
                 target=device.daq.node_monitor,
-                conditions={n.path: n.value for n in filter_conditions(dev_nodes)},
+                conditions={n.path: n.value for n in node_set.conditions},
             )
             failed_path, _ = conditions_checker.check_all()
             if failed_path is None:
@@ -132,12 +131,12 @@ class DeviceCollection:
                         value=node.raw_value,
                         caching_strategy=CachingStrategy.NO_CACHE,
                     )
-                    for node in filter_commands(dev_nodes)
+                    for node in node_set.commands
                 ]
             )
             response_waiter.add(
                 target=device.daq.node_monitor,
-                conditions={n.path: n.value for n in filter_responses(dev_nodes)},
+                conditions={n.path: n.value for n in node_set.responses},
             )
 
         if not set_nodes:
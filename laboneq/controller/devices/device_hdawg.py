@@ -18,7 +18,11 @@ from laboneq.controller.communication import (
     DaqNodeAction,
     DaqNodeSetAction,
 )
-from laboneq.controller.devices.device_zi import DeviceZI, delay_to_rounded_samples
+from laboneq.controller.devices.device_zi import (
+    DeviceZI,
+    delay_to_rounded_samples,
+    iter_osc_channels,
+)
 from laboneq.controller.devices.zi_node_monitor import (
     Command,
     Condition,
@@ -410,7 +414,7 @@ class DeviceHDAWG(DeviceZI):
                 nodes.append((f"triggers/out/{output.channel}/delay", 0.0))
 
         osc_selects = {
-            ch: osc.index for osc in self._allocated_oscs for ch in osc.channels
+            ch: osc.index for osc in self._allocated_oscs for ch in iter_osc_channels(osc.channels)
         }
         for ch, osc_idx in osc_selects.items():
             nodes.append((f"sines/{ch}/oscselect", osc_idx))
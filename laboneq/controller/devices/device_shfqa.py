@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import time
 from typing import Any, Iterator
@@ -40,7 +41,6 @@ from laboneq.controller.recipe_processor import (
     DeviceRecipeData,
     RecipeData,
     RtExecutionInfo,
-    get_wave,
 )
 from laboneq.controller.util import LabOneQControllerException
 from laboneq.core.types.enums.acquisition_type import AcquisitionType, is_spectroscopy
@@ -52,6 +52,10 @@ INTERNAL_TRIGGER_CHANNEL = 1024  # PQSC style triggering on the SHFSG/QC
 SOFTWARE_TRIGGER_CHANNEL = 8  # Software triggering on the SHFQA
 
 SAMPLE_FREQUENCY_HZ = 2.0e9
+INPUT_RANGES_DBM = np.array(
+    [-50, -30, -25, -20, -15, -10, -5, 0, 5, 10], dtype=np.float64
+)
+OUTPUT_RANGES_DBM = np.array([-30, -25, -20, -15, -10, -5, 0, 5, 10], dtype=np.float64)
 DELAY_NODE_GRANULARITY_SAMPLES = 4
 DELAY_NODE_MAX_SAMPLES = 1e-6 * SAMPLE_FREQUENCY_HZ
 # About DELAY_NODE_MAX_SAMPLES: The max time is actually 131e-6 s (at least I can set that
@@ -69,6 +73,11 @@ class DeviceSHFQA(DeviceSHFBase):
         self._channels = 4
         self._wait_for_awgs = True
         self._emit_trigger = False
+        # Node path prefix, precomputed once to avoid rebuilding it in hot loops
+        self._qach_prefix = f"/{self.serial}/qachannels"
+        # Content hashes of already queued integration weights per node path,
+        # used to skip re-uploading identical kernels shared between qubits
+        self._uploaded_weight_hashes: dict[str, bytes] = {}
 
     @property
     def dev_repr(self) -> str:
@@ -91,15 +100,19 @@ class DeviceSHFQA(DeviceSHFBase):
             )
             self._channels = 4
 
+    def disconnect(self):
+        super().disconnect()
+        self._uploaded_weight_hashes.clear()
+
     def _get_sequencer_type(self) -> str:
         return "qa"
 
     def get_sequencer_paths(self, index: int) -> SequencerPaths:
         return SequencerPaths(
-            elf=f"/{self.serial}/qachannels/{index}/generator/elf/data",
-            progress=f"/{self.serial}/qachannels/{index}/generator/elf/progress",
-            enable=f"/{self.serial}/qachannels/{index}/generator/enable",
-            ready=f"/{self.serial}/qachannels/{index}/generator/ready",
+            elf=f"{self._qach_prefix}/{index}/generator/elf/data",
+            progress=f"{self._qach_prefix}/{index}/generator/elf/progress",
+            enable=f"{self._qach_prefix}/{index}/generator/enable",
+            ready=f"{self._qach_prefix}/{index}/generator/ready",
         )
 
     def _get_num_awgs(self):
@@ -108,13 +121,7 @@ class DeviceSHFQA(DeviceSHFBase):
     def _validate_range(self, io: IO.Data, is_out: bool):
         if io.range is None:
             return
-        input_ranges = np.array(
-            [-50, -30, -25, -20, -15, -10, -5, 0, 5, 10], dtype=np.float64
-        )
-        output_ranges = np.array(
-            [-30, -25, -20, -15, -10, -5, 0, 5, 10], dtype=np.float64
-        )
-        range_list = output_ranges if is_out else input_ranges
+        range_list = OUTPUT_RANGES_DBM if is_out else INPUT_RANGES_DBM
         label = "Output" if is_out else "Input"
 
         if io.range_unit not in (None, "dBm"):
@@ -122,7 +129,7 @@ class DeviceSHFQA(DeviceSHFBase):
                 f"{label} range of device {self.dev_repr} is specified in "
                 f"units of {io.range_unit}. Units must be 'dBm'."
             )
-        if not any(np.isclose([io.range] * len(range_list), range_list)):
+        if not np.any(np.isclose(io.range, range_list)):
             _logger.warning(
                 "%s: %s channel %d range %.1f is not on the list of allowed ranges: %s. "
                 "Nearest allowed range will be used.",
@@ -144,7 +151,7 @@ class DeviceSHFQA(DeviceSHFBase):
         return previously_allocated
 
     def _make_osc_path(self, channel: int, index: int) -> str:
-        return f"/{self.serial}/qachannels/{channel}/oscs/{index}/freq"
+        return f"{self._qach_prefix}/{channel}/oscs/{index}/freq"
 
     def disable_outputs(
         self, outputs: set[int], invert: bool
@@ -155,7 +162,7 @@ class DeviceSHFQA(DeviceSHFBase):
                 channels_to_disable.append(
                     DaqNodeSetAction(
                         self._daq,
-                        f"/{self.serial}/qachannels/{ch}/output/on",
+                        f"{self._qach_prefix}/{ch}/output/on",
                         0,
                         caching_strategy=CachingStrategy.NO_CACHE,
                     )
@@ -169,7 +176,7 @@ class DeviceSHFQA(DeviceSHFBase):
             # in CW spectroscopy mode, turn off the tone
             DaqNodeSetAction(
                 self._daq,
-                f"/{self.serial}/qachannels/*/spectroscopy/envelope/enable",
+                f"{self._qach_prefix}/*/spectroscopy/envelope/enable",
                 1,
             ),
         ]
@@ -179,11 +186,11 @@ class DeviceSHFQA(DeviceSHFBase):
         for awg in range(self._get_num_awgs()):
             nodes.extend(
                 [
-                    f"/{self.serial}/qachannels/{awg}/generator/enable",
-                    f"/{self.serial}/qachannels/{awg}/generator/ready",
-                    f"/{self.serial}/qachannels/{awg}/spectroscopy/psd/enable",
-                    f"/{self.serial}/qachannels/{awg}/spectroscopy/result/enable",
-                    f"/{self.serial}/qachannels/{awg}/readout/result/enable",
+                    f"{self._qach_prefix}/{awg}/generator/enable",
+                    f"{self._qach_prefix}/{awg}/generator/ready",
+                    f"{self._qach_prefix}/{awg}/spectroscopy/psd/enable",
+                    f"{self._qach_prefix}/{awg}/spectroscopy/result/enable",
+                    f"{self._qach_prefix}/{awg}/readout/result/enable",
                 ]
             )
         return nodes
@@ -238,35 +245,36 @@ class DeviceSHFQA(DeviceSHFBase):
             AcquisitionType.DISCRIMINATION,
         ]
         channel = awg_key.awg_index
+        readout_base = f"{self._qach_prefix}/{channel}/readout"
         nodes_to_initialize_readout = []
         if enable:
             nodes_to_initialize_readout.extend(
                 [
                     DaqNodeSetAction(
                         self._daq,
-                        f"/{self.serial}/qachannels/{channel}/readout/result/length",
+                        f"{readout_base}/result/length",
                         awg_config.result_length,
                     ),
                     DaqNodeSetAction(
                         self._daq,
-                        f"/{self.serial}/qachannels/{channel}/readout/result/averages",
+                        f"{readout_base}/result/averages",
                         averages,
                     ),
                     DaqNodeSetAction(
                         self._daq,
-                        f"/{self.serial}/qachannels/{channel}/readout/result/source",
+                        f"{readout_base}/result/source",
                         # 1 - result_of_integration
                         # 3 - result_of_discrimination
                         3 if acquisition_type == AcquisitionType.DISCRIMINATION else 1,
                     ),
                     DaqNodeSetAction(
                         self._daq,
-                        f"/{self.serial}/qachannels/{channel}/readout/result/mode",
+                        f"{readout_base}/result/mode",
                         average_mode,
                     ),
                     DaqNodeSetAction(
                         self._daq,
-                        f"/{self.serial}/qachannels/{channel}/readout/result/enable",
+                        f"{readout_base}/result/enable",
                         0,
                     ),
                 ]
@@ -286,15 +294,14 @@ class DeviceSHFQA(DeviceSHFBase):
                     nodes_to_initialize_readout.append(
                         DaqNodeSetAction(
                             self._daq,
-                            f"/{self.serial}/qachannels/{channel}/readout/discriminators/"
-                            f"{integrator_idx}/threshold",
+                            f"{readout_base}/discriminators/{integrator_idx}/threshold",
                             integrator.threshold,
                         )
                     )
         nodes_to_initialize_readout.append(
             DaqNodeSetAction(
                 self._daq,
-                f"/{self.serial}/qachannels/{channel}/readout/result/enable",
+                f"{readout_base}/result/enable",
                 1 if enable else 0,
             )
         )
@@ -308,33 +315,34 @@ class DeviceSHFQA(DeviceSHFBase):
         averages: int,
         average_mode: int,
     ):
+        spectroscopy_base = f"{self._qach_prefix}/{channel}/spectroscopy"
         nodes_to_initialize_spectroscopy = []
         if is_spectroscopy(acq_type):
             nodes_to_initialize_spectroscopy.extend(
                 [
                     DaqNodeSetAction(
                         self._daq,
-                        f"/{self.serial}/qachannels/{channel}/spectroscopy/result/length",
+                        f"{spectroscopy_base}/result/length",
                         result_length,
                     ),
                     DaqNodeSetAction(
                         self._daq,
-                        f"/{self.serial}/qachannels/{channel}/spectroscopy/result/averages",
+                        f"{spectroscopy_base}/result/averages",
                         averages,
                     ),
                     DaqNodeSetAction(
                         self._daq,
-                        f"/{self.serial}/qachannels/{channel}/spectroscopy/result/mode",
+                        f"{spectroscopy_base}/result/mode",
                         average_mode,
                     ),
                     DaqNodeSetAction(
                         self._daq,
-                        f"/{self.serial}/qachannels/{channel}/spectroscopy/psd/enable",
+                        f"{spectroscopy_base}/psd/enable",
                         0,
                     ),
                     DaqNodeSetAction(
                         self._daq,
-                        f"/{self.serial}/qachannels/{channel}/spectroscopy/result/enable",
+                        f"{spectroscopy_base}/result/enable",
                         0,
                     ),
                 ]
@@ -344,7 +352,7 @@ class DeviceSHFQA(DeviceSHFBase):
             nodes_to_initialize_spectroscopy.append(
                 DaqNodeSetAction(
                     self._daq,
-                    f"/{self.serial}/qachannels/{channel}/spectroscopy/psd/enable",
+                    f"{spectroscopy_base}/psd/enable",
                     1,
                 ),
             )
@@ -352,7 +360,7 @@ class DeviceSHFQA(DeviceSHFBase):
         nodes_to_initialize_spectroscopy.append(
             DaqNodeSetAction(
                 self._daq,
-                f"/{self.serial}/qachannels/{channel}/spectroscopy/result/enable",
+                f"{spectroscopy_base}/result/enable",
                 1 if is_spectroscopy(acq_type) else 0,
             )
         )
@@ -430,7 +438,7 @@ class DeviceSHFQA(DeviceSHFBase):
         return [
             DaqNodeSetAction(
                 self._daq,
-                f"/{self.serial}/qachannels/{awg_index}/generator/enable",
+                f"{self._qach_prefix}/{awg_index}/generator/enable",
                 1,
                 caching_strategy=CachingStrategy.NO_CACHE,
             )
@@ -459,7 +467,7 @@ class DeviceSHFQA(DeviceSHFBase):
         if self._wait_for_awgs:
             for awg_index in self._allocated_awgs:
                 conditions[
-                    f"/{self.serial}/qachannels/{awg_index}/generator/enable"
+                    f"{self._qach_prefix}/{awg_index}/generator/enable"
                 ] = 1
         return conditions
 
@@ -468,17 +476,17 @@ class DeviceSHFQA(DeviceSHFBase):
     ) -> dict[str, Any]:
         conditions: dict[str, Any] = {}
         for awg_index in self._allocated_awgs:
-            conditions[f"/{self.serial}/qachannels/{awg_index}/generator/enable"] = 0
+            conditions[f"{self._qach_prefix}/{awg_index}/generator/enable"] = 0
             if is_spectroscopy(acquisition_type):
                 conditions[
-                    f"/{self.serial}/qachannels/{awg_index}/spectroscopy/result/enable"
+                    f"{self._qach_prefix}/{awg_index}/spectroscopy/result/enable"
                 ] = 0
             elif acquisition_type in [
                 AcquisitionType.INTEGRATION,
                 AcquisitionType.DISCRIMINATION,
             ]:
                 conditions[
-                    f"/{self.serial}/qachannels/{awg_index}/readout/result/enable"
+                    f"{self._qach_prefix}/{awg_index}/readout/result/enable"
                 ] = 0
         return conditions
 
@@ -537,7 +545,7 @@ class DeviceSHFQA(DeviceSHFBase):
             nodes_to_initialize_output.append(
                 DaqNodeSetAction(
                     self._daq,
-                    f"/{self.serial}/qachannels/{output.channel}/output/on",
+                    f"{self._qach_prefix}/{output.channel}/output/on",
                     1 if output.enable else 0,
                 )
             )
@@ -546,7 +554,7 @@ class DeviceSHFQA(DeviceSHFBase):
                 nodes_to_initialize_output.append(
                     DaqNodeSetAction(
                         self._daq,
-                        f"/{self.serial}/qachannels/{output.channel}/output/range",
+                        f"{self._qach_prefix}/{output.channel}/output/range",
                         output.range,
                     )
                 )
@@ -554,7 +562,7 @@ class DeviceSHFQA(DeviceSHFBase):
             nodes_to_initialize_output.append(
                 DaqNodeSetAction(
                     self._daq,
-                    f"/{self.serial}/qachannels/{output.channel}/generator/single",
+                    f"{self._qach_prefix}/{output.channel}/generator/single",
                     1,
                 )
             )
@@ -578,7 +586,7 @@ class DeviceSHFQA(DeviceSHFBase):
                 nodes_to_set.append(
                     DaqNodeSetAction(
                         self._daq,
-                        f"/{self.serial}/qachannels/{ch}/centerfreq",
+                        f"{self._qach_prefix}/{ch}/centerfreq",
                         synth_cf,
                     )
                 )
@@ -590,7 +598,7 @@ class DeviceSHFQA(DeviceSHFBase):
                 nodes_to_set.append(
                     DaqNodeSetAction(
                         self._daq,
-                        f"/{self.serial}/qachannels/{ch}/oscs/0/gain",
+                        f"{self._qach_prefix}/{ch}/oscs/0/gain",
                         out_amp,
                     )
                 )
@@ -627,7 +635,7 @@ class DeviceSHFQA(DeviceSHFBase):
             )
             set_input = input_updated and input_scheduler_port_delay is not None
 
-            base_channel_path = f"/{self.serial}/qachannels/{ch}"
+            base_channel_path = f"{self._qach_prefix}/{ch}"
             if is_spectroscopy(acquisition_type):
                 output_delay_path = f"{base_channel_path}/spectroscopy/envelope/delay"
                 meas_delay_path = f"{base_channel_path}/spectroscopy/delay"
@@ -684,9 +692,9 @@ class DeviceSHFQA(DeviceSHFBase):
         assert not is_spectroscopy(acquisition_type) or wave_index == 0
         return DaqNodeSetAction(
             self._daq,
-            f"/{self.serial}/qachannels/{awg_index}/spectroscopy/envelope/wave"
+            f"{self._qach_prefix}/{awg_index}/spectroscopy/envelope/wave"
             if is_spectroscopy(acquisition_type)
-            else f"/{self.serial}/qachannels/{awg_index}/generator/waveforms/{wave_index}/wave",
+            else f"{self._qach_prefix}/{awg_index}/generator/waveforms/{wave_index}/wave",
             waveform,
             filename=filename,
             caching_strategy=CachingStrategy.NO_CACHE,
@@ -751,7 +759,7 @@ class DeviceSHFQA(DeviceSHFBase):
         waves_upload.append(
             DaqNodeSetAction(
                 self._daq,
-                f"/{self.serial}/qachannels/{awg_index}/spectroscopy/envelope/enable",
+                f"{self._qach_prefix}/{awg_index}/spectroscopy/envelope/enable",
                 1 if has_spectroscopy_envelope else 0,
             )
         )
@@ -770,58 +778,73 @@ class DeviceSHFQA(DeviceSHFBase):
         nodes_to_set_for_readout_mode = [
             DaqNodeSetAction(
                 self._daq,
-                f"/{self.serial}/qachannels/{measurement.channel}/readout/integration/length",
+                f"{self._qach_prefix}/{measurement.channel}/readout/integration/length",
                 measurement.length,
             ),
         ]
 
         max_len = 4096
-        for (
-            integrator_allocation
-        ) in recipe_data.recipe.experiment.integrator_allocations:
-            if (
-                integrator_allocation.device_id != device_uid
-                or integrator_allocation.awg != measurement.channel
-            ):
-                continue
-            if integrator_allocation.weights is None:
-                # Skip configuration if no integration weights provided to keep same behavior
-                # TODO(2K): Consider not emitting the integrator allocation in this case.
-                continue
+        # Pre-filter the allocations relevant for this measurement, skipping those
+        # without integration weights to keep same behavior.
+        # TODO(2K): Consider not emitting the integrator allocation in that case.
+        relevant_allocations = [
+            ia
+            for ia in recipe_data.recipe.experiment.integrator_allocations
+            if ia.device_id == device_uid
+            and ia.awg == measurement.channel
+            and ia.weights is not None
+        ]
 
+        def weight_for(integrator_allocation: IntegratorAllocation.Data):
             if len(integrator_allocation.channels) != 1:
                 raise LabOneQControllerException(
                     f"{self.dev_repr}: Internal error - expected 1 integrator for "
                     f"signal '{integrator_allocation.signal_id}', "
                     f"got {len(integrator_allocation.channels)}"
                 )
-            integration_unit_index = integrator_allocation.channels[0]
             wave_name = integrator_allocation.weights + ".wave"
-            weight_vector = np.conjugate(
-                get_wave(wave_name, recipe_data.scheduled_experiment.waves)
+            # Cast to the device-native complex64 up front - halves the bytes
+            # transferred per integration weight upload.
+            weight_vector = np.conjugate(recipe_data.get_wave(wave_name)).astype(
+                np.complex64, copy=False
             )
             wave_len = len(weight_vector)
             if wave_len > max_len:
                 max_pulse_len = max_len / SAMPLE_FREQUENCY_HZ
                 raise LabOneQControllerException(
                     f"{self.dev_repr}: Length {wave_len} of the integration weight "
-                    f"'{integration_unit_index}' of channel {measurement.channel} exceeds "
-                    f"maximum of {max_len} samples. Ensure length of acquire kernels don't "
+                    f"'{integrator_allocation.channels[0]}' of channel "
+                    f"{measurement.channel} exceeds maximum of {max_len} samples. "
+                    f"Ensure length of acquire kernels don't "
                     f"exceed {max_pulse_len * 1e6:.3f} us."
                 )
-            node_path = (
-                f"/{self.serial}/qachannels/{measurement.channel}/readout/integration/"
-                f"weights/{integration_unit_index}/wave"
-            )
-            nodes_to_set_for_readout_mode.append(
+            return integrator_allocation.channels[0], wave_name, weight_vector
+
+        prepared_weights = [weight_for(ia) for ia in relevant_allocations]
+        weights_base = (
+            f"{self._qach_prefix}/{measurement.channel}/readout/integration/weights"
+        )
+        # Local bindings to avoid repeated attribute/global lookups in the loop
+        daq = self._daq
+        uploaded_weight_hashes = self._uploaded_weight_hashes
+        append_node = nodes_to_set_for_readout_mode.append
+        for integration_unit_index, wave_name, weight_vector in prepared_weights:
+            node_path = f"{weights_base}/{integration_unit_index}/wave"
+            weight_hash = hashlib.blake2b(
+                weight_vector.tobytes(), digest_size=16
+            ).digest()
+            if uploaded_weight_hashes.get(node_path) == weight_hash:
+                continue
+            append_node(
                 DaqNodeSetAction(
-                    self._daq,
+                    daq,
                     node_path,
                     weight_vector,
                     filename=wave_name,
                     caching_strategy=CachingStrategy.CACHE,
                 )
             )
+            uploaded_weight_hashes[node_path] = weight_hash
         return nodes_to_set_for_readout_mode
 
     def _configure_spectroscopy_mode_nodes(
@@ -832,12 +855,12 @@ class DeviceSHFQA(DeviceSHFBase):
         nodes_to_set_for_spectroscopy_mode = [
             DaqNodeSetAction(
                 self._daq,
-                f"/{self.serial}/qachannels/{measurement.channel}/spectroscopy/trigger/channel",
+                f"{self._qach_prefix}/{measurement.channel}/spectroscopy/trigger/channel",
                 32 + measurement.channel,
             ),
             DaqNodeSetAction(
                 self._daq,
-                f"/{self.serial}/qachannels/{measurement.channel}/spectroscopy/length",
+                f"{self._qach_prefix}/{measurement.channel}/spectroscopy/length",
                 measurement.length,
             ),
         ]
@@ -852,33 +875,27 @@ class DeviceSHFQA(DeviceSHFBase):
         acquisition_type = RtExecutionInfo.get_acquisition_type(
             recipe_data.rt_execution_infos
         )
-
+        spectroscopy = is_spectroscopy(acquisition_type)
+
+        inputs_by_channel = {inp.channel: inp for inp in initialization.inputs or []}
+        outputs_by_channel = {
+            output.channel: output for output in initialization.outputs or []
+        }
+        # Local bindings to avoid repeated attribute lookups in the loop
+        daq = self._daq
+        qach_prefix = self._qach_prefix
         for measurement in initialization.measurements:
             nodes_to_initialize_measurement.append(
                 DaqNodeSetAction(
-                    self._daq,
-                    f"/{self.serial}/qachannels/{measurement.channel}/mode",
-                    0 if is_spectroscopy(acquisition_type) else 1,
+                    daq,
+                    f"{qach_prefix}/{measurement.channel}/mode",
+                    0 if spectroscopy else 1,
                 )
             )
 
-            dev_input = next(
-                (
-                    inp
-                    for inp in initialization.inputs
-                    if inp.channel == measurement.channel
-                ),
-                None,
-            )
-            dev_output = next(
-                (
-                    output
-                    for output in initialization.outputs
-                    if output.channel == measurement.channel
-                ),
-                None,
-            )
-            if is_spectroscopy(acquisition_type):
+            dev_input = inputs_by_channel.get(measurement.channel)
+            dev_output = outputs_by_channel.get(measurement.channel)
+            if spectroscopy:
                 nodes_to_initialize_measurement.extend(
                     self._configure_spectroscopy_mode_nodes(dev_input, measurement)
                 )
@@ -901,7 +918,7 @@ class DeviceSHFQA(DeviceSHFBase):
             nodes_to_initialize_measurement.append(
                 DaqNodeSetAction(
                     self._daq,
-                    f"/{self.serial}/qachannels/{dev_input.channel}/input/on",
+                    f"{self._qach_prefix}/{dev_input.channel}/input/on",
                     1,
                 )
             )
@@ -910,7 +927,7 @@ class DeviceSHFQA(DeviceSHFBase):
                 nodes_to_initialize_measurement.append(
                     DaqNodeSetAction(
                         self._daq,
-                        f"/{self.serial}/qachannels/{dev_input.channel}/input/range",
+                        f"{self._qach_prefix}/{dev_input.channel}/input/range",
                         dev_input.range,
                     )
                 )
@@ -927,7 +944,7 @@ class DeviceSHFQA(DeviceSHFBase):
             nodes_to_initialize_measurement.append(
                 DaqNodeSetAction(
                     self._daq,
-                    f"/{self.serial}/qachannels/{measurement.channel}/generator/"
+                    f"{self._qach_prefix}/{measurement.channel}/generator/"
                     f"auxtriggers/0/channel",
                     channel,
                 )
@@ -967,7 +984,7 @@ class DeviceSHFQA(DeviceSHFBase):
         for awg_index in (
             self._allocated_awgs if len(self._allocated_awgs) > 0 else range(1)
         ):
-            markers_base = f"/{self.serial}/qachannels/{awg_index}/markers"
+            markers_base = f"{self._qach_prefix}/{awg_index}/markers"
             src = 32 + awg_index
             nodes_to_configure_triggers.append(
                 DaqNodeSetAction(self._daq, f"{markers_base}/0/source", src),
@@ -986,46 +1003,65 @@ class DeviceSHFQA(DeviceSHFBase):
         hw_averages: int,
     ):
         assert len(result_indices) == 1
-        result_path = f"/{self.serial}/qachannels/{channel}/" + (
-            "spectroscopy/result/data/wave"
-            if is_spectroscopy(acquisition_type)
-            else f"readout/result/data/{result_indices[0]}/wave"
+        spectroscopy = is_spectroscopy(acquisition_type)
+        unit = "spectroscopy" if spectroscopy else "readout"
+        result_path = f"{self._qach_prefix}/{channel}/" + (
+            f"{unit}/result/data/wave"
+            if spectroscopy
+            else f"{unit}/result/data/{result_indices[0]}/wave"
         )
-        attempts = 3  # Hotfix HBAR-949
+        acquired_path = f"{self._qach_prefix}/{channel}/{unit}/result/acquired"
+        # Hotfix HBAR-949: poll the cheap scalar 'acquired' counter instead of
+        # repeatedly downloading the full result vector.
+        attempts = 3
         while attempts > 0:
             attempts -= 1
-            # @TODO(andreyk): replace the raw daq reply parsing on site here and hide it
-            # inside Communication class
-            data_node_query = self._daq.get_raw(result_path)
-            actual_num_measurement_points = len(
-                data_node_query[result_path][0]["vector"]
+            batch_get_results = self._daq.batch_get(
+                [
+                    DaqNodeGetAction(
+                        self._daq,
+                        acquired_path,
+                        caching_strategy=CachingStrategy.NO_CACHE,
+                    )
+                ]
             )
-            if actual_num_measurement_points < num_results:
+            if batch_get_results[acquired_path] < num_results:
                 time.sleep(0.1)
                 continue
             break
+        # @TODO(andreyk): replace the raw daq reply parsing on site here and hide it
+        # inside Communication class
+        data_node_query = self._daq.get_raw(result_path)
+        actual_num_measurement_points = len(data_node_query[result_path][0]["vector"])
         assert actual_num_measurement_points == num_results, (
             f"number of measurement points {actual_num_measurement_points} returned by daq "
             f"from device '{self.dev_repr}' does not match length of recipe "
             f"measurement_map which is {num_results}"
         )
-        result: npt.ArrayLike = data_node_query[result_path][0]["vector"]
+        result: npt.ArrayLike = np.asarray(data_node_query[result_path][0]["vector"])
         if acquisition_type == AcquisitionType.DISCRIMINATION:
+            # .real is a zero-copy view into the complex result vector
             return result.real
         return result
 
     def get_input_monitor_data(self, channel: int, num_results: int):
         result_path_ch = f"/{self.serial}/scopes/0/channels/{channel}/wave"
         node_data = self._daq.get_raw(result_path_ch)
-        data = node_data[result_path_ch][0]["vector"][0:num_results]
-        return data
+        vec = np.asarray(node_data[result_path_ch][0]["vector"])
+        assert len(vec) >= num_results, (
+            f"scope read from device '{self.dev_repr}' returned only {len(vec)} "
+            f"samples, expected at least {num_results}"
+        )
+        # zero-copy view of the first num_results samples
+        return vec[:num_results]
 
     def check_results_acquired_status(
         self, channel, acquisition_type: AcquisitionType, result_length, hw_averages
     ):
         unit = "spectroscopy" if is_spectroscopy(acquisition_type) else "readout"
+        expected_results = result_length * hw_averages
         results_acquired_path = (
-            f"/{self.serial}/qachannels/{channel}/{unit}/result/acquired"
+            f"{self._qach_prefix}/{channel}/{unit}/result/acquired"
         )
         batch_get_results = self._daq.batch_get(
             [
@@ -1037,7 +1073,6 @@ class DeviceSHFQA(DeviceSHFBase):
             ]
         )
         actual_results = batch_get_results[results_acquired_path]
-        expected_results = result_length * hw_averages
         if actual_results != expected_results:
             raise LabOneQControllerException(
                 f"The number of measurements ({actual_results}) executed for device {self.serial} "
@@ -1048,52 +1083,23 @@ class DeviceSHFQA(DeviceSHFBase):
 
     def collect_reset_nodes(self) -> list[DaqNodeAction]:
         reset_nodes = super().collect_reset_nodes()
-        reset_nodes.append(
-            DaqNodeSetAction(
-                self._daq,
-                f"/{self.serial}/qachannels/*/generator/enable",
-                0,
-                caching_strategy=CachingStrategy.NO_CACHE,
-            )
-        )
-        reset_nodes.append(
-            DaqNodeSetAction(
-                self._daq,
-                f"/{self.serial}/qachannels/*/readout/result/enable",
-                0,
-                caching_strategy=CachingStrategy.NO_CACHE,
-            )
-        )
-        reset_nodes.append(
-            DaqNodeSetAction(
-                self._daq,
-                f"/{self.serial}/qachannels/*/spectroscopy/psd/enable",
-                0,
-                caching_strategy=CachingStrategy.NO_CACHE,
-            )
-        )
-        reset_nodes.append(
-            DaqNodeSetAction(
-                self._daq,
-                f"/{self.serial}/qachannels/*/spectroscopy/result/enable",
-                0,
-                caching_strategy=CachingStrategy.NO_CACHE,
-            )
-        )
-        reset_nodes.append(
-            DaqNodeSetAction(
-                self._daq,
-                f"/{self.serial}/scopes/0/enable",
-                0,
-                caching_strategy=CachingStrategy.NO_CACHE,
-            )
+        # Ordering matters here and is preserved within the single batched set
+        # performed by the transport layer.
+        reset_paths = (
+            f"{self._qach_prefix}/*/generator/enable",
+            f"{self._qach_prefix}/*/readout/result/enable",
+            f"{self._qach_prefix}/*/spectroscopy/psd/enable",
+            f"{self._qach_prefix}/*/spectroscopy/result/enable",
+            f"/{self.serial}/scopes/0/enable",
+            f"/{self.serial}/scopes/0/channels/*/enable",
         )
-        reset_nodes.append(
+        reset_nodes.extend(
             DaqNodeSetAction(
                 self._daq,
-                f"/{self.serial}/scopes/0/channels/*/enable",
+                path,
                 0,
                 caching_strategy=CachingStrategy.NO_CACHE,
             )
+            for path in reset_paths
         )
         return reset_nodes
@@ -20,7 +20,7 @@ from laboneq.controller.communication import (
     DaqNodeSetAction,
 )
 from laboneq.controller.devices.device_shf_base import DeviceSHFBase
-from laboneq.controller.devices.device_zi import SequencerPaths
+from laboneq.controller.devices.device_zi import SequencerPaths, iter_osc_channels
 from laboneq.controller.devices.zi_node_monitor import NodeControlBase
 from laboneq.controller.recipe_1_4_0 import IO, Initialization
 from laboneq.controller.recipe_enums import TriggeringMode
@@ -358,7 +358,7 @@ class DeviceSHFSG(DeviceSHFBase):
             )
 
         osc_selects = {
-            ch: osc.index for osc in self._allocated_oscs for ch in osc.channels
+            ch: osc.index for osc in self._allocated_oscs for ch in iter_osc_channels(osc.channels)
         }
         for ch, osc_idx in osc_selects.items():
             nodes_to_initialize_output.append(
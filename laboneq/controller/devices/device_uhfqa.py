@@ -28,7 +28,6 @@ from laboneq.controller.recipe_processor import (
     DeviceRecipeData,
     RecipeData,
     RtExecutionInfo,
-    get_wave,
 )
 from laboneq.controller.util import LabOneQControllerException
 from laboneq.core.types.enums.acquisition_type import AcquisitionType
@@ -490,9 +489,8 @@ class DeviceUHFQA(DeviceZI):
                             self._daq,
                             f"/{self.serial}/qas/0/integration/weights/"
                             f"{integration_unit_index}/real",
-                            get_wave(
-                                integrator_allocation.weights + "_i.wave",
-                                recipe_data.scheduled_experiment.waves,
+                            recipe_data.get_wave(
+                                integrator_allocation.weights + "_i.wave"
                             ),
                         ),
                         DaqNodeSetAction(
@@ -500,9 +498,8 @@ class DeviceUHFQA(DeviceZI):
                             f"/{self.serial}/qas/0/integration/weights/"
                             f"{integration_unit_index}/imag",
                             np.negative(
-                                get_wave(
-                                    integrator_allocation.weights + "_q.wave",
-                                    recipe_data.scheduled_experiment.waves,
+                                recipe_data.get_wave(
+                                    integrator_allocation.weights + "_q.wave"
                                 )
                             ),
                         ),
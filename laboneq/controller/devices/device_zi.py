@@ -3,13 +3,12 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import math
 import re
 import time
 from abc import ABC
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from math import floor
@@ -17,8 +16,8 @@ from typing import Any, Iterator
 from weakref import ReferenceType, ref
 
 import numpy as np
+import orjson
 import zhinst.core
-import zhinst.utils
 from numpy import typing as npt
 from zhinst.core.errors import CoreError as LabOneCoreError
 
@@ -57,6 +56,10 @@ seqc_osc_match = re.compile(
     r'(\s*string\s+osc_node_)(\w+)(\s*=\s*"oscs/)[0-9]+(/freq"\s*;\s*)', re.ASCII
 )
 
+# Matches the '{"$ref": "<oscillator uid>"}' objects in a serialized command
+# table - the only place where '$ref' occurs in the command table schema.
+ct_osc_ref_match = re.compile(r'\{\s*"\$ref"\s*:\s*"([^"]+)"\s*\}')
+
 
 class AwgCompilerStatus(Enum):
     SUCCESS = 0
@@ -67,13 +70,21 @@ class AwgCompilerStatus(Enum):
 @dataclass
 class AllocatedOscillator:
     group: int
-    channels: set[int]
+    channels: int  # bitmask of channels sharing this oscillator
     index: int
     id: str
     frequency: float
     param: str
 
 
+def iter_osc_channels(mask: int) -> Iterator[int]:
+    """Yield the channel numbers set in an oscillator channels bitmask."""
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+
 @dataclass
 class DeviceOptions:
     serial: str
@@ -163,6 +174,19 @@ class DeviceZI(ABC):
         self.dev_opts: list[str] = []
         self._connected = False
         self._allocated_oscs: list[AllocatedOscillator] = []
+        # Auxiliary indexes over _allocated_oscs for O(1) allocation lookups
+        self._osc_by_key: dict[tuple[int, str], AllocatedOscillator] = {}
+        self._oscs_per_group: dict[int, int] = {}
+        # Memoized prepare_seqc/prepare_waves/prepare_command_table outputs,
+        # keyed by (kind, experiment identity, ref, oscillator signature)
+        self._prepare_cache: dict[tuple, Any] = {}
+        # Per-experiment ref lookup indexes, rebuilt when a new scheduled
+        # experiment is seen. The experiment is held by strong reference -
+        # comparing a stored id() would misfire if a garbage-collected
+        # experiment's id were reused.
+        self._indexed_experiment: ScheduledExperiment | None = None
+        self._wave_indices_by_name: dict[str, Any] = {}
+        self._ct_by_seqc: dict[str, Any] = {}
         self._allocated_awgs: set[int] = set()
         self._nodes_to_monitor = None
         self._sampling_rate = None
@@ -170,6 +194,13 @@ class DeviceZI(ABC):
         if self._daq is None:
             raise LabOneQControllerException("ZI devices need daq")
 
+        # Normalize once - the properties are read in many hot loops
+        options = self._device_qualifier.options
+        self._serial = None if options.serial is None else options.serial.lower()
+        self._interface = (
+            None if options.interface is None else options.interface.lower()
+        )
+
         if self.serial is None:
             raise LabOneQControllerException(
                 "ZI device must be provided with serial number via options"
@@ -180,6 +211,11 @@ class DeviceZI(ABC):
                 "ZI device must be provided with interface via options"
             )
 
+        # Node path prefixes, precomputed once for the path-building hot spots
+        self._serial_prefix = f"/{self.serial}"
+        self._awg_prefix = f"{self._serial_prefix}/awgs/"
+        self._osc_prefix = f"{self._serial_prefix}/oscs/"
+
     @property
     def device_qualifier(self):
         return self._device_qualifier
@@ -202,11 +238,11 @@ class DeviceZI(ABC):
 
     @property
     def serial(self):
-        return self.options.serial.lower()
+        return self._serial
 
     @property
     def interface(self):
-        return self.options.interface.lower()
+        return self._interface
 
     @property
     def daq(self):
@@ -245,11 +281,12 @@ class DeviceZI(ABC):
         return "auto-detect"
 
     def get_sequencer_paths(self, index: int) -> SequencerPaths:
+        awg_base = self._awg_prefix + str(index)
         return SequencerPaths(
-            elf=f"/{self.serial}/awgs/{index}/elf/data",
-            progress=f"/{self.serial}/awgs/{index}/elf/progress",
-            enable=f"/{self.serial}/awgs/{index}/enable",
-            ready=f"/{self.serial}/awgs/{index}/ready",
+            elf=awg_base + "/elf/data",
+            progress=awg_base + "/elf/progress",
+            enable=awg_base + "/enable",
+            ready=awg_base + "/ready",
         )
 
     def add_downlink(self, port: str, linked_device_uid: str, linked_device: DeviceZI):
@@ -351,6 +388,12 @@ class DeviceZI(ABC):
 
     def connect(self):
         self._connect_to_data_server()
+        # Note on round trips: the devtype/options reads above are already
+        # coalesced into a single batch_get (and served from the node cache on
+        # reconnect), and registering monitor nodes is a purely local operation
+        # - the actual subscription happens later in NodeMonitor.start().
+        # The monitored node list depends on the device type fetched above, so
+        # it cannot be computed ahead of the features read.
         self._daq.node_monitor.add_nodes(self.nodes_to_monitor())
 
     def disconnect(self):
@@ -387,8 +430,27 @@ class DeviceZI(ABC):
 
     def free_allocations(self):
         self._allocated_oscs.clear()
+        self._osc_by_key.clear()
+        self._oscs_per_group.clear()
+        self._prepare_cache.clear()
+        self._indexed_experiment = None
+        self._wave_indices_by_name.clear()
+        self._ct_by_seqc.clear()
         self._allocated_awgs.clear()
 
+    def _osc_signature(self) -> tuple:
+        return tuple((o.param, o.index) for o in self._allocated_oscs)
+
+    def _index_experiment(self, scheduled_experiment: ScheduledExperiment):
+        if self._indexed_experiment is not scheduled_experiment:
+            self._wave_indices_by_name = {
+                i["filename"]: i for i in scheduled_experiment.wave_indices or []
+            }
+            self._ct_by_seqc = {
+                ct["seqc"]: ct for ct in scheduled_experiment.command_tables or []
+            }
+            self._indexed_experiment = scheduled_experiment
+
     def _nodes_to_monitor_impl(self):
         nodes = []
         nodes.extend([node.path for node in self.clock_source_control_nodes()])
@@ -428,29 +490,33 @@ class DeviceZI(ABC):
         return None
 
     def _make_osc_path(self, channel: int, index: int) -> str:
-        return f"/{self.serial}/oscs/{index}/freq"
+        return self._osc_prefix + str(index) + "/freq"
 
     def allocate_osc(self, osc_param: OscillatorParam.Data):
         osc_group = self._osc_group_by_channel(osc_param.channel)
-        osc_group_oscs = [o for o in self._allocated_oscs if o.group == osc_group]
-        same_id_osc = next((o for o in osc_group_oscs if o.id == osc_param.id), None)
+        same_id_osc = self._osc_by_key.get((osc_group, osc_param.id))
         if same_id_osc is None:
             # pylint: disable=E1128
-            new_index = self._get_next_osc_index(osc_group, len(osc_group_oscs))
+            new_index = self._get_next_osc_index(
+                osc_group, self._oscs_per_group.get(osc_group, 0)
+            )
             if new_index is None:
                 raise LabOneQControllerException(
                     f"{self.dev_repr}: exceeded the number of available oscillators for "
                     f"channel {osc_param.channel}"
                 )
-            self._allocated_oscs.append(
-                AllocatedOscillator(
-                    group=osc_group,
-                    channels={osc_param.channel},
-                    index=new_index,
-                    id=osc_param.id,
-                    frequency=osc_param.frequency,
-                    param=osc_param.param,
-                )
+            new_osc = AllocatedOscillator(
+                group=osc_group,
+                channels=1 << osc_param.channel,
+                index=new_index,
+                id=osc_param.id,
+                frequency=osc_param.frequency,
+                param=osc_param.param,
+            )
+            self._allocated_oscs.append(new_osc)
+            self._osc_by_key[(osc_group, osc_param.id)] = new_osc
+            self._oscs_per_group[osc_group] = (
+                self._oscs_per_group.get(osc_group, 0) + 1
             )
         else:
             if same_id_osc.frequency != osc_param.frequency:
@@ -458,7 +524,7 @@ class DeviceZI(ABC):
                     f"{self.dev_repr}: ambiguous frequency in recipe for oscillator "
                     f"'{osc_param.id}': {same_id_osc.frequency} != {osc_param.frequency}"
                 )
-            same_id_osc.channels.add(osc_param.channel)
+            same_id_osc.channels |= 1 << osc_param.channel
 
     def configure_feedback(self, recipe_data: RecipeData) -> list[DaqNodeAction]:
         return []
@@ -502,16 +568,77 @@ class DeviceZI(ABC):
 
     def _wait_for_node(
         self, path: str, expected: Any, timeout: float, guard_time: float = 0
+    ):
+        node_monitor = self._daq.node_monitor
+        if node_monitor is None:
+            # No monitor available for this connection - fall back to polling gets
+            self._wait_for_node_by_get(path, expected, timeout, guard_time)
+            return
+
+        # Event-driven wait: let the data server push value changes instead of
+        # re-reading the node in a 10 Hz busy loop.
+        node_monitor.ensure_subscribed(path)
+        node_monitor.fetch([path])
+
+        start_time = time.monotonic()
+        last_report = start_time
+        guard_start = None
+        last_val = None
+        sleep_time = 0.001
+
+        while True:
+            now = time.monotonic()
+            if now - start_time > timeout:
+                raise LabOneQControllerException(
+                    f"{self.dev_repr}: Node '{path}' didn't switch to '{expected}' "
+                    f"within {timeout}s. Last value: {last_val}"
+                )
+            if now - last_report > 5:
+                _logger.debug(
+                    "Waiting for node '%s' switching to '%s', %f s remaining "
+                    "until %f s timeout...",
+                    path,
+                    expected,
+                    timeout - floor(now - start_time),
+                    timeout,
+                )
+                last_report = now
+
+            node_monitor.poll()
+            while True:
+                val = node_monitor.pop(path)
+                if val is None:
+                    break
+                last_val = val
+                if val != expected:
+                    guard_start = None  # Start over the guard time waiting
+                elif guard_start is None:
+                    guard_start = time.monotonic()
+
+            if self.dry_run and last_val is not None:
+                break
+
+            if guard_start is not None and time.monotonic() - guard_start >= guard_time:
+                break
+
+            # Exponential backoff: react within ~1 ms to fast nodes, but avoid
+            # busy-spinning on slow ones.
+            time.sleep(sleep_time)
+            sleep_time = min(0.05, sleep_time * 1.5)
+
+    def _wait_for_node_by_get(
+        self, path: str, expected: Any, timeout: float, guard_time: float = 0
     ):
         retries = 0
-        start_time = time.time()
+        start_time = time.monotonic()
         guard_start = None
         last_report = start_time
         last_val = None
+        sleep_time = 0.001
 
         while True:
             if retries > 0:
-                now = time.time()
+                now = time.monotonic()
                 elapsed = floor(now - start_time)
                 if now - start_time > timeout:
                     raise LabOneQControllerException(
@@ -528,7 +655,8 @@ class DeviceZI(ABC):
                         timeout,
                     )
                     last_report = now
-                time.sleep(0.1)
+                time.sleep(sleep_time)
+                sleep_time = min(0.1, sleep_time * 1.5)
             retries += 1
 
             daq_reply = self._daq.batch_get(
@@ -548,8 +676,8 @@ class DeviceZI(ABC):
                 continue
 
             if guard_start is None:
-                guard_start = time.time()
-            if time.time() - guard_start >= guard_time:
+                guard_start = time.monotonic()
+            if time.monotonic() - guard_start >= guard_time:
                 break
 
     def _adjust_frequency(self, freq):
@@ -566,7 +694,7 @@ class DeviceZI(ABC):
             )
             if updated:
                 osc_freq_adjusted = self._adjust_frequency(osc_freq)
-                for ch in osc.channels:
+                for ch in iter_osc_channels(osc.channels):
                     nodes_to_set.append(
                         DaqNodeSetAction(
                             self._daq,
@@ -576,40 +704,81 @@ class DeviceZI(ABC):
                     )
         return nodes_to_set
 
+    @staticmethod
+    def _interleave_waves(
+        wave1: npt.ArrayLike,
+        wave2: npt.ArrayLike | None = None,
+        markers: npt.ArrayLike | None = None,
+    ) -> npt.ArrayLike:
+        """Interleave waveform and marker streams into the native AWG uint16
+        wire format.
+
+        Produces the same data as zhinst.utils.convert_awg_waveform, but each
+        stream is cast directly into a strided view of the preallocated output
+        buffer, avoiding the library's vstack and reshape intermediates.
+        """
+        n = len(wave1)
+        for other, label in ((wave2, "wave2"), (markers, "markers")):
+            if other is not None and len(other) != n:
+                raise LabOneQControllerException(
+                    f"wave1 and {label} have different length. "
+                    f"They should have the same length."
+                )
+        scale = np.power(2, 15) - 1
+        streams = []
+        for stream in (wave1, wave2):
+            if stream is None:
+                continue
+            arr = np.asarray(stream)
+            if np.issubdtype(arr.dtype, np.floating):
+                arr = arr * scale
+            streams.append(arr)
+        if markers is not None:
+            streams.append(np.asarray(markers))
+        out = np.empty(n * len(streams), dtype=np.uint16)
+        for k, arr in enumerate(streams):
+            out[k :: len(streams)] = arr.astype(np.uint16, copy=False)
+        return out
+
+    @staticmethod
+    def _clipped_samples(samples) -> npt.ArrayLike:
+        """Clip samples to [-1, 1], avoiding the copy when already in range."""
+        arr = np.asarray(samples)
+        if arr.size == 0 or (arr.min() >= -1 and arr.max() <= 1):
+            return arr
+        return np.clip(arr, -1, 1)
+
     @staticmethod
     def _contains_only_zero_or_one(a):
         if a is None:
             return True
-        return not np.any(a * (1 - a))
-
-    def _prepare_wave_iq(self, waves, sig: str) -> tuple[str, npt.ArrayLike]:
-        wave_i = next((w for w in waves if w["filename"] == f"{sig}_i.wave"), None)
+        arr = np.asarray(a)
+        if arr.size == 0:
+            return True
+        if arr.dtype.kind in "iu":
+            # Single pass, no temporaries for the common integer markers
+            return bool(arr.min() >= 0 and arr.max() <= 1)
+        return bool(np.all((arr == 0) | (arr == 1)))
+
+    def _prepare_wave_iq(
+        self, waves_by_name: dict[str, Any], sig: str
+    ) -> tuple[str, npt.ArrayLike]:
+        wave_i = waves_by_name.get(f"{sig}_i.wave")
         if not wave_i:
             raise LabOneQControllerException(
                 f"I wave not found, IQ wave signature '{sig}'"
             )
 
-        wave_q = next((w for w in waves if w["filename"] == f"{sig}_q.wave"), None)
+        wave_q = waves_by_name.get(f"{sig}_q.wave")
         if not wave_q:
             raise LabOneQControllerException(
                 f"Q wave not found, IQ wave signature '{sig}'"
             )
 
-        marker1_samples = None
-        marker2_samples = None
-        try:
-            marker1_samples = next(
-                (w for w in waves if w["filename"] == f"{sig}_marker1.wave")
-            )["samples"]
-        except StopIteration:
-            pass
-
-        try:
-            marker2_samples = next(
-                (w for w in waves if w["filename"] == f"{sig}_marker2.wave")
-            )["samples"]
-        except StopIteration:
-            pass
+        marker1_wave = waves_by_name.get(f"{sig}_marker1.wave")
+        marker2_wave = waves_by_name.get(f"{sig}_marker2.wave")
+        marker1_samples = None if marker1_wave is None else marker1_wave["samples"]
+        marker2_samples = None if marker2_wave is None else marker2_wave["samples"]
 
         marker_samples = None
         if marker1_samples is not None:
@@ -619,9 +788,9 @@ class DeviceZI(ABC):
                 )
             marker_samples = np.array(marker1_samples)
         if marker2_samples is not None:
-            if marker_samples is None:
-                marker_samples = np.zeros(len(marker2_samples), dtype=np.int32)
-            elif len(marker1_samples) != len(marker2_samples):
+            if marker1_samples is not None and len(marker1_samples) != len(
+                marker2_samples
+            ):
                 raise LabOneQControllerException(
                     "Samples for marker1 and marker2 must have the same length"
                 )
@@ -629,31 +798,36 @@ class DeviceZI(ABC):
                 raise LabOneQControllerException(
                     "Marker samples must only contain ones and zeros"
                 )
-            marker2_samples = np.array(marker2_samples)
             # we want marker 2 to be played on output 2, marker 1
             # bits 0/1 = marker 1/2 of output 1, bit 2/4 = marker 1/2 output 2
-            # bit 2 is factor 4
-            factor = 4
-            marker_samples += factor * marker2_samples
+            # marker 2 therefore goes to bit 2; pack with a single-allocation
+            # bitwise shift/or instead of the multiply + add temporaries
+            packed = np.left_shift(np.asarray(marker2_samples, dtype=np.int32), 2)
+            if marker_samples is None:
+                marker_samples = packed
+            else:
+                np.bitwise_or(
+                    packed,
+                    marker_samples.astype(np.int32, copy=False),
+                    out=packed,
+                )
+                marker_samples = packed
 
         return (
             sig,
-            zhinst.utils.convert_awg_waveform(
-                np.clip(wave_i["samples"], -1, 1),
-                np.clip(wave_q["samples"], -1, 1),
+            self._interleave_waves(
+                self._clipped_samples(wave_i["samples"]),
+                self._clipped_samples(wave_q["samples"]),
                 markers=marker_samples,
             ),
         )
 
-    def _prepare_wave_single(self, waves, sig: str) -> tuple[str, npt.ArrayLike]:
-        wave = next((w for w in waves if w["filename"] == f"{sig}.wave"), None)
-        marker_samples = None
-        try:
-            marker_samples = next(
-                (w for w in waves if w["filename"] == f"{sig}_marker1.wave")
-            )["samples"]
-        except StopIteration:
-            pass
+    def _prepare_wave_single(
+        self, waves_by_name: dict[str, Any], sig: str
+    ) -> tuple[str, npt.ArrayLike]:
+        wave = waves_by_name.get(f"{sig}.wave")
+        marker_wave = waves_by_name.get(f"{sig}_marker1.wave")
+        marker_samples = None if marker_wave is None else marker_wave["samples"]
 
         if not self._contains_only_zero_or_one(marker_samples):
             raise LabOneQControllerException(
@@ -663,79 +837,125 @@ class DeviceZI(ABC):
         if not wave:
             raise LabOneQControllerException(f"Wave not found, signature '{sig}'")
 
-        return sig, zhinst.utils.convert_awg_waveform(
-            np.clip(wave["samples"], -1, 1), markers=marker_samples
+        return sig, self._interleave_waves(
+            self._clipped_samples(wave["samples"]), markers=marker_samples
         )
 
-    def _prepare_wave_complex(self, waves, sig: str) -> tuple[str, npt.ArrayLike]:
+    def _prepare_wave_complex(
+        self, waves_by_name: dict[str, Any], sig: str
+    ) -> tuple[str, npt.ArrayLike]:
         filename_to_find = f"{sig}.wave"
-        wave = next((w for w in waves if w["filename"] == filename_to_find), None)
+        wave = waves_by_name.get(filename_to_find)
 
         if not wave:
             raise LabOneQControllerException(
                 f"Wave not found, signature '{sig}' filename '{filename_to_find}'"
             )
 
-        return sig, np.array(wave["samples"], dtype=np.complex128)
+        # No copy if the samples already are a complex128 ndarray - the buffer
+        # is only read downstream by the upload action.
+        return sig, np.asarray(wave["samples"], dtype=np.complex128)
 
     def prepare_waves(
         self, scheduled_experiment: ScheduledExperiment, wave_indices_ref: str
     ) -> Waveforms:
         if wave_indices_ref is None:
             return None
-        wave_indices: dict[str, list[int | str]] = next(
-            (
-                i
-                for i in scheduled_experiment.wave_indices
-                if i["filename"] == wave_indices_ref
-            ),
-            {"value": {}},
+        cache_key = (
+            "waves",
+            id(scheduled_experiment),
+            wave_indices_ref,
+            self._osc_signature(),
+        )
+        cached = self._prepare_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        self._index_experiment(scheduled_experiment)
+        wave_indices: dict[str, list[int | str]] = self._wave_indices_by_name.get(
+            wave_indices_ref, {"value": {}}
         )["value"]
 
         waves = scheduled_experiment.waves or []
-        bin_waves: Waveforms = []
-        for sig, [index, sig_type] in wave_indices.items():
+        waves_by_name = {w["filename"]: w for w in waves}
+
+        def prepare_one(item: tuple[str, list[int | str]]) -> WaveformItem:
+            sig, [index, sig_type] = item
             if sig_type in ("iq", "double", "multi"):
-                name, samples = self._prepare_wave_iq(waves, sig)
+                name, samples = self._prepare_wave_iq(waves_by_name, sig)
             elif sig_type == "single":
-                name, samples = self._prepare_wave_single(waves, sig)
+                name, samples = self._prepare_wave_single(waves_by_name, sig)
             elif sig_type == "complex":
-                name, samples = self._prepare_wave_complex(waves, sig)
+                name, samples = self._prepare_wave_complex(waves_by_name, sig)
             else:
                 raise LabOneQControllerException(
                     f"Unexpected signal type for binary wave for '{sig}' in '{wave_indices_ref}' - "
                     f"'{sig_type}', should be one of [iq, double, multi, single, complex]"
                 )
-            bin_waves.append(WaveformItem(index=index, name=name, samples=samples))
+            return WaveformItem(index=index, name=name, samples=samples)
+
+        if len(wave_indices) > 4:
+            # The heavy lifting is in NumPy, which releases the GIL - prepare
+            # the waveforms in parallel, map() preserves the order.
+            with ThreadPoolExecutor() as pool:
+                bin_waves: Waveforms = list(pool.map(prepare_one, wave_indices.items()))
+        else:
+            bin_waves = [prepare_one(item) for item in wave_indices.items()]
 
+        self._prepare_cache[cache_key] = bin_waves
         return bin_waves
 
     def prepare_command_table(
         self, scheduled_experiment: ScheduledExperiment, ct_ref: str
-    ) -> dict | None:
+    ) -> dict | str | None:
         if ct_ref is None:
             return None
-        command_table_body = next(
-            (
-                ct["ct"]
-                for ct in scheduled_experiment.command_tables
-                if ct["seqc"] == ct_ref
-            ),
-            None,
+        cache_key = (
+            "command_table",
+            id(scheduled_experiment),
+            ct_ref,
+            self._osc_signature(),
         )
-
-        if command_table_body is None:
+        cached = self._prepare_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        self._index_experiment(scheduled_experiment)
+        command_table = self._ct_by_seqc.get(ct_ref)
+        if command_table is None:
             return None
+        command_table_body = command_table["ct"]
 
         oscillator_map = {osc.id: osc.index for osc in self._allocated_oscs}
-        command_table_body = deepcopy(command_table_body)
-        for entry in command_table_body:
-            if "oscillatorSelect" not in entry:
-                continue
-            oscillator_uid = entry["oscillatorSelect"]["value"]["$ref"]
-            entry["oscillatorSelect"]["value"] = oscillator_map[oscillator_uid]
-
-        return self.add_command_table_header(command_table_body)
+        if isinstance(command_table_body, str):
+            # Body arrived as serialized JSON - patch the oscillator '$ref'
+            # objects directly in the text and splice the result into the
+            # serialized header, skipping the parse/re-emit round-trip.
+            # '$ref' only occurs in oscillatorSelect values.
+            patched_body = ct_osc_ref_match.sub(
+                lambda m: str(oscillator_map[m.group(1)]), command_table_body
+            )
+            header_json = orjson.dumps(self.add_command_table_header([])).decode()
+            command_table = header_json.replace('"table":[]', '"table":' + patched_body)
+        else:
+            # Only the entries carrying an oscillatorSelect are rewritten -
+            # clone just those shallowly instead of deep-copying the whole
+            # table body.
+            patched_body = []
+            for entry in command_table_body:
+                osc_select = entry.get("oscillatorSelect")
+                if osc_select is not None:
+                    oscillator_uid = osc_select["value"]["$ref"]
+                    entry = {
+                        **entry,
+                        "oscillatorSelect": {
+                            **osc_select,
+                            "value": oscillator_map[oscillator_uid],
+                        },
+                    }
+                patched_body.append(entry)
+            command_table = self.add_command_table_header(patched_body)
+
+        self._prepare_cache[cache_key] = command_table
+        return command_table
 
     def prepare_seqc(
         self, scheduled_experiment: ScheduledExperiment, seqc_ref: str
@@ -743,6 +963,16 @@ class DeviceZI(ABC):
         if seqc_ref is None:
             return None
 
+        cache_key = (
+            "seqc",
+            id(scheduled_experiment),
+            seqc_ref,
+            self._osc_signature(),
+        )
+        cached = self._prepare_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         seqc = next(
             (s for s in scheduled_experiment.src if s["filename"] == seqc_ref), None
         )
@@ -750,18 +980,16 @@ class DeviceZI(ABC):
             raise LabOneQControllerException(f"SeqC program '{seqc_ref}' not found")
 
         # Substitute oscillator nodes by actual assignment
-        seqc_lines = seqc["text"].split("\n")
-        for i, seqc_line in enumerate(seqc_lines):
-            m = seqc_osc_match.match(seqc_line)
-            if m is not None:
-                param = m.group(2)
-                for osc in self._allocated_oscs:
-                    if osc.param == param:
-                        seqc_lines[
-                            i
-                        ] = f"{m.group(1)}{m.group(2)}{m.group(3)}{osc.index}{m.group(4)}"
-        seqc_text = "\n".join(seqc_lines)
+        param_to_index = {osc.param: osc.index for osc in self._allocated_oscs}
 
+        def subst_osc_index(m: re.Match) -> str:
+            index = param_to_index.get(m.group(2))
+            if index is None:
+                return m.group(0)
+            return f"{m.group(1)}{m.group(2)}{m.group(3)}{index}{m.group(4)}"
+
+        seqc_text = seqc_osc_match.sub(subst_osc_index, seqc["text"])
+        self._prepare_cache[cache_key] = seqc_text
         return seqc_text
 
     def prepare_upload_elf(self, elf: bytes, awg_index: int, filename: str):
@@ -796,7 +1024,11 @@ class DeviceZI(ABC):
         waves: Waveforms,
         acquisition_type: AcquisitionType,
     ):
-        # Default implementation for "old" devices, override for newer devices
+        # Default implementation for "old" devices, override for newer devices.
+        # All actions of one batch are submitted to the data server in a single
+        # API set call by the transport layer. Dispatch through
+        # prepare_upload_binary_wave - subclasses override it with their own
+        # node paths.
         return [
             self.prepare_upload_binary_wave(
                 filename=wave.name,
@@ -808,12 +1040,20 @@ class DeviceZI(ABC):
             for wave in waves
         ]
 
-    def prepare_upload_command_table(self, awg_index, command_table: dict):
+    def prepare_upload_command_table(self, awg_index, command_table: dict | str):
         command_table_path = self.command_table_path(awg_index)
+        # JSON is order-independent and the device parser does not require
+        # canonical key ordering - use the C-implemented orjson without sorting.
+        # A command table prepared from serialized JSON is already text.
+        value = (
+            command_table
+            if isinstance(command_table, str)
+            else orjson.dumps(command_table).decode()
+        )
         return DaqNodeSetAction(
             self._daq,
             command_table_path + "data",
-            json.dumps(command_table, sort_keys=True),
+            value,
             caching_strategy=CachingStrategy.NO_CACHE,
         )
 
@@ -889,7 +1129,7 @@ class DeviceZI(ABC):
         osc_inits = {
             self._make_osc_path(ch, osc.index): osc.frequency
             for osc in self._allocated_oscs
-            for ch in osc.channels
+            for ch in iter_osc_channels(osc.channels)
         }
         for path, freq in osc_inits.items():
             nodes_to_initialize_oscs.append(
@@ -912,14 +1152,20 @@ class DeviceZI(ABC):
         _logger.debug("%s: Executing AWGS...", self.dev_repr)
 
         if self._daq is not None:
+            # All actions returned here are coalesced by batch_set into a
+            # single API transaction - build them with minimal overhead.
+            daq = self._daq
+            awg_prefix = self._awg_prefix
             for awg_index in self._allocated_awgs:
                 _logger.debug(
                     "%s: Starting AWG #%d sequencer", self.dev_repr, awg_index
                 )
-                path = f"/{self.serial}/awgs/{awg_index}/enable"
                 nodes_to_execute.append(
                     DaqNodeSetAction(
-                        self._daq, path, 1, caching_strategy=CachingStrategy.NO_CACHE
+                        daq,
+                        f"{awg_prefix}{awg_index}/enable",
+                        1,
+                        caching_strategy=CachingStrategy.NO_CACHE,
                     )
                 )
 
@@ -946,21 +1192,25 @@ class DeviceErrorSeverity(Enum):
     error = 2
 
 
+_ERROR_SEVERITY_LEVEL = DeviceErrorSeverity.error.value
+
+
 def check_errors(errors, serial):
     collected_messages = []
+    append_message = collected_messages.append
     for error in errors:
-        # the key in error["vector"] looks like a dict, but it's a string. so we have to use
-        # json.loads to convert it into a dict.
-        error_vector = json.loads(error["vector"])
+        # the key in error["vector"] looks like a dict, but it's a string. so we have to
+        # parse it into a dict - orjson also takes bytes directly, without a decode.
+        error_vector = orjson.loads(error["vector"])
         for message in error_vector["messages"]:
-            if message["code"] == "AWGRUNTIMEERROR" and message["params"][0] == 1:
+            if message.get("code") == "AWGRUNTIMEERROR" and message["params"][0] == 1:
                 awg_core = int(message["attribs"][0])
                 program_counter = int(message["params"][1])
-                collected_messages.append(
+                append_message(
                     f"Gap detected on AWG core {awg_core}, program counter {program_counter}"
                 )
-            if message["severity"] >= DeviceErrorSeverity.error.value:
-                collected_messages.append(message["message"])
+            if message["severity"] >= _ERROR_SEVERITY_LEVEL:
+                append_message(message["message"])
     if len(collected_messages) > 0:
         all_messages = "\n".join(collected_messages)
         raise LabOneQControllerException(
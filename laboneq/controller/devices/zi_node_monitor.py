@@ -6,9 +6,11 @@ from __future__ import annotations
 import logging
 import math
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
 from laboneq._observability.tracing import trace
 
@@ -18,17 +20,20 @@ _logger = logging.getLogger(__name__)
 @dataclass
 class Node:
     path: str
-    values: list[Any] = field(default_factory=list)
+    values: deque[Any] = field(default_factory=deque)
     last: Any | None = None
+    # Bumped on every update - lets checkers skip re-matching unchanged nodes
+    version: int = 0
 
     def flush(self):
         self.values.clear()
+        self.version += 1
 
     def peek(self) -> Any | None:
         return None if len(self.values) == 0 else self.values[0]
 
     def pop(self) -> Any | None:
-        return None if len(self.values) == 0 else self.values.pop(0)
+        return None if len(self.values) == 0 else self.values.popleft()
 
     def get_last(self) -> Any | None:
         return self.last
@@ -36,28 +41,48 @@ class Node:
     def append(self, val: dict[str, Any]):
         self.values.extend(val["value"])
         self.last = self.values[-1]
+        self.version += 1
 
 
-def _is_expected(val: Any, expected: list[Any | None]) -> bool:
-    for e in expected:
+def _compile_expected(expected: Any) -> Callable[[Any], bool]:
+    """Compile an expected condition value into a matcher callable.
+
+    The per-value dispatch (None / FloatWithTolerance / exact match) is done
+    once here instead of per polled update in the wait loops.
+    """
+    # expected may be None, single value or a list
+    all_expected = expected if isinstance(expected, Iterable) else [expected]
+    matchers: list[Callable[[Any], bool]] = []
+    tolerance_matchers: list[Callable[[Any], bool]] = []
+    for e in all_expected:
         if e is None:
             # No specific value expected, any update matches
-            return True
-        if isinstance(e, FloatWithTolerance) and math.isclose(
-            val, e.val, abs_tol=e.abs_tol
-        ):
+            return lambda val: True
+        if isinstance(e, FloatWithTolerance):
             # Float with given tolerance
-            return True
-        if val == e:
-            # Otherwise exact match
-            return True
-    return False
+            tolerance_matchers.append(
+                lambda val, v=e.val, a=e.abs_tol: math.isclose(val, v, abs_tol=a)
+            )
+        else:
+            # Otherwise exact match - by far the most common case, so try
+            # these before any tolerance comparisons
+            matchers.append(lambda val, e=e: val == e)
+    matchers += tolerance_matchers
+    if len(matchers) == 1:
+        return matchers[0]
+    return lambda val: any(m(val) for m in matchers)
 
 
 class NodeMonitor:
     def __init__(self, daq):
         self._daq = daq
         self._nodes: dict[str, Node] = {}
+        # Compiled condition matchers, keyed by path and tagged with the
+        # originating expected value to detect changed conditions
+        self._matchers: dict[str, tuple[Any, Callable[[Any], bool]]] = {}
+        # Monitored paths, materialized lazily for start(). A list, as the
+        # emulator API accepts only 'str | list[str]' paths.
+        self._paths_cache: list[str] | None = None
 
     def _log_missing_node(self, path: str):
         _logger.warning(
@@ -74,35 +99,62 @@ class NodeMonitor:
     def reset(self):
         self.stop()
         self._nodes.clear()
+        self._paths_cache = None
 
     def add_nodes(self, paths: list[str]):
         for path in paths:
             if path not in self._nodes:
                 self._nodes[path] = Node(path)
+                self._paths_cache = None
+
+    def ensure_subscribed(self, path: str):
+        if path not in self._nodes:
+            self._nodes[path] = Node(path)
+            self._paths_cache = None
+            self._daq.subscribe(path)
 
     def start(self):
-        all_paths = [p for p in self._nodes.keys()]
-        if len(all_paths) > 0:
-            self._daq.subscribe(all_paths)
+        if self._paths_cache is None:
+            self._paths_cache = list(self._nodes)
+        if len(self._paths_cache) > 0:
+            self._daq.subscribe(self._paths_cache)
 
     def fetch(self, paths: list[str]):
+        # getAsEvent is fire-and-forget - the values arrive with the next
+        # poll. The ziAPI accepts only a single plain path per call, so bind
+        # the method once and submit the batch back-to-back without waiting.
+        get_as_event = self._daq.getAsEvent
         for path in paths:
-            self._daq.getAsEvent(path)
+            get_as_event(path)
 
     def stop(self):
+        # unsubscribe already serializes with the data server - don't pay
+        # for a second round-trip in the flush
         self._daq.unsubscribe("*")
-        self.flush()
+        self.flush(sync=False)
 
     def poll(self):
+        # Ingest update bursts with locally bound lookups and the Node.append
+        # body inlined - this loop runs per polled value on the wait hot path.
+        nodes = self._nodes
+        poll_api = self._daq.poll
         while True:
-            data = self._daq.poll(1e-6, 100, flat=True)
+            data = poll_api(1e-6, 100, flat=True)
             if len(data) == 0:
                 break
             for path, val in data.items():
-                self._get_node(path).append(val)
-
-    def flush(self):
-        self._daq.sync()
+                node = nodes.get(path)
+                if node is None:
+                    self._log_missing_node(path)
+                    continue
+                values = node.values
+                values.extend(val["value"])
+                node.last = values[-1]
+                node.version += 1
+
+    def flush(self, sync: bool = True):
+        if sync:
+            self._daq.sync()
         for node in self._nodes.values():
             node.flush()
 
@@ -115,37 +167,58 @@ class NodeMonitor:
     def get_last(self, path: str) -> Any | None:
         return self._get_node(path).get_last()
 
-    def check_last_for_conditions(self, conditions: dict[str, Any]) -> str:
+    def _matcher_for(self, path: str, expected: Any) -> Callable[[Any], bool]:
+        cached = self._matchers.get(path)
+        if cached is not None and cached[0] is expected:
+            return cached[1]
+        matcher = _compile_expected(expected)
+        self._matchers[path] = (expected, matcher)
+        return matcher
+
+    def check_last_for_conditions(
+        self, conditions: dict[str, Any], ok_versions: dict[str, int] | None = None
+    ) -> str:
+        # Bind attribute lookups outside the loop - these methods run in
+        # tight wait loops over potentially large conditions dicts
+        nodes = self._nodes
+        matcher_for = self._matcher_for
         for path, expected in conditions.items():
-            if path not in self._nodes:
+            node = nodes.get(path)
+            if node is None:
                 self._log_missing_node(path)
                 return path
-            # expected may be None, single value or a list
-            all_expected = expected if isinstance(expected, Iterable) else [expected]
-            val = self.get_last(path)
+            if ok_versions is not None and ok_versions.get(path) == node.version:
+                # Node unchanged since it last matched - skip re-evaluation
+                continue
+            is_expected = matcher_for(path, expected)
+            val = node.last
             if val is None:
                 return path
-            if not _is_expected(val, all_expected):
+            if not is_expected(val):
                 return path
+            if ok_versions is not None:
+                ok_versions[path] = node.version
         return None
 
     def poll_and_check_conditions(self, conditions: dict[str, Any]) -> dict[str, Any]:
         self.poll()
         remaining = {}
+        nodes = self._nodes
+        matcher_for = self._matcher_for
         for path, expected in conditions.items():
-            if path not in self._nodes:
+            node = nodes.get(path)
+            if node is None:
                 self._log_missing_node(path)
                 continue
-            # expected may be None, single value or a list
-            all_expected = expected if isinstance(expected, Iterable) else [expected]
+            is_expected = matcher_for(path, expected)
+            values = node.values
             while True:
-                val = self.pop(path)
-                if val is None:
+                if not values:
                     # No further updates for the path,
                     # keep condition as is for the next check iteration
                     remaining[path] = expected
                     break
-                if _is_expected(val, all_expected):
+                if is_expected(values.popleft()):
                     break
         return remaining
 
@@ -157,6 +230,10 @@ class MultiDeviceHandlerBase:
     def add(self, target: NodeMonitor, conditions: dict[str, Any]):
         daq_conditions: dict[str, Any] = self._conditions.setdefault(target, {})
         daq_conditions.update(conditions)
+        # Normalize and compile the expected values right away, so the wait
+        # loops start with all matchers ready.
+        for path, expected in conditions.items():
+            target._matcher_for(path, expected)
 
 
 class ConditionsChecker(MultiDeviceHandlerBase):
@@ -168,9 +245,27 @@ class ConditionsChecker(MultiDeviceHandlerBase):
     see AllRepliesWaiter for details.
     """
 
+    def __init__(self):
+        super().__init__()
+        # Versions of nodes that already matched - unchanged nodes are not
+        # re-evaluated on subsequent check_all calls
+        self._ok_versions: dict[NodeMonitor, dict[str, int]] = {}
+
+    def add(self, target: NodeMonitor, conditions: dict[str, Any]):
+        super().add(target, conditions)
+        # Re-registered paths may carry new expected values - drop their
+        # cached match so check_all re-evaluates them
+        ok_versions = self._ok_versions.get(target)
+        if ok_versions:
+            for path in conditions:
+                ok_versions.pop(path, None)
+
     def check_all(self) -> tuple[str, Any]:
         for node_monitor, daq_conditions in self._conditions.items():
-            failed_path = node_monitor.check_last_for_conditions(daq_conditions)
+            ok_versions = self._ok_versions.setdefault(node_monitor, {})
+            failed_path = node_monitor.check_last_for_conditions(
+                daq_conditions, ok_versions
+            )
             if failed_path is not None:
                 return failed_path, daq_conditions[failed_path]
         return None, None
@@ -227,22 +322,55 @@ class ResponseWaiter(MultiDeviceHandlerBase):
 
     def __init__(self):
         super().__init__()
-        self._timer = time.time
+        self._timer = time.monotonic
 
     @trace("wait-for-all-nodes", disable_tracing_during=True)
     def wait_all(self, timeout: float) -> bool:
-        start = self._timer()
+        if len(self._conditions) > 1:
+            # Monitors poll independent data server connections - overlap them
+            with ThreadPoolExecutor(max_workers=len(self._conditions)) as pool:
+                return self._wait_all_impl(timeout, pool)
+        return self._wait_all_impl(timeout, None)
+
+    def _wait_all_impl(self, timeout: float, pool: ThreadPoolExecutor | None) -> bool:
+        timer = self._timer
+        start = timer()
+        sleep_time = 1e-4
+        prev_remaining_count: int | None = None
         while True:
+            monitor_conditions = list(self._conditions.items())
+            if pool is None or len(monitor_conditions) == 1:
+                poll_results = [
+                    node_monitor.poll_and_check_conditions(daq_conditions)
+                    for node_monitor, daq_conditions in monitor_conditions
+                ]
+            else:
+                poll_results = list(
+                    pool.map(
+                        lambda mc: mc[0].poll_and_check_conditions(mc[1]),
+                        monitor_conditions,
+                    )
+                )
             remaining: dict[NodeMonitor, dict[str, Any]] = {}
-            for node_monitor, daq_conditions in self._conditions.items():
-                daq_remaining = node_monitor.poll_and_check_conditions(daq_conditions)
+            remaining_count = 0
+            for (node_monitor, _), daq_remaining in zip(
+                monitor_conditions, poll_results
+            ):
                 if len(daq_remaining) > 0:
                     remaining[node_monitor] = daq_remaining
+                    remaining_count += len(daq_remaining)
             if len(remaining) == 0:
                 return True
-            if self._timer() - start > timeout:
+            if timer() - start > timeout:
                 return False
             self._conditions = remaining
+            # Back off exponentially while nothing new arrives, resetting to
+            # fast polling whenever some conditions got fulfilled.
+            if prev_remaining_count is not None and remaining_count < prev_remaining_count:
+                sleep_time = 1e-4
+            prev_remaining_count = remaining_count
+            time.sleep(sleep_time)
+            sleep_time = min(sleep_time * 2, 1e-2)
 
     def remaining(self) -> dict[str, Any]:
         all_conditions: dict[str, Any] = {}
@@ -280,61 +408,83 @@ class NodeControlBase:
         )
 
 
-@dataclass
-class Condition(NodeControlBase):
+# The former Condition/Command/Response/Prepare subclasses existed only to
+# set 'kind' in __post_init__ - plain factories skip that per-instance cost.
+
+
+def Condition(path: str, value: Any) -> NodeControlBase:
     """Represents a condition to be fulfilled. Condition node may not
     necessarily receive an update after executing Command(s), if it has
     already the right value, for instance extref freq, but still must be
     verified."""
+    return NodeControlBase(path, value, NodeControlKind.Condition)
 
-    def __post_init__(self):
-        self.kind = NodeControlKind.Condition
 
-
-@dataclass
-class Command(NodeControlBase):
+def Command(path: str, value: Any) -> NodeControlBase:
     """Represents a command node. The node will be set, if conditions
     are not fulfilled. Also treated as a response and a condition."""
+    return NodeControlBase(path, value, NodeControlKind.Command)
 
-    def __post_init__(self):
-        self.kind = NodeControlKind.Command
 
-
-@dataclass
-class Response(NodeControlBase):
+def Response(path: str, value: Any) -> NodeControlBase:
     """Represents a response, expected in return to
     the executed Command(s). Also treated as a condition."""
-
-    def __post_init__(self):
-        self.kind = NodeControlKind.Response
+    return NodeControlBase(path, value, NodeControlKind.Response)
 
 
-@dataclass
-class Prepare(NodeControlBase):
+def Prepare(path: str, value: Any) -> NodeControlBase:
     """Represents a command node, that has to be set only as
     a preparation before the main Command(s), but shouldn't be touched
     or be in a specific state otherwise."""
+    return NodeControlBase(path, value, NodeControlKind.Prepare)
+
 
-    def __post_init__(self):
-        self.kind = NodeControlKind.Prepare
+@dataclass
+class NodeControlSet:
+    """Control nodes bucketed by kind, built in a single pass over the list."""
+
+    prepare: list[NodeControlBase] = field(default_factory=list)
+    command: list[NodeControlBase] = field(default_factory=list)
+    response: list[NodeControlBase] = field(default_factory=list)
+    condition: list[NodeControlBase] = field(default_factory=list)
+
+    @classmethod
+    def from_nodes(cls, nodes: list[NodeControlBase]) -> NodeControlSet:
+        node_set = cls()
+        # O(1) dict dispatch per node - no per-node membership scans over
+        # kind filter lists
+        buckets = {
+            NodeControlKind.Prepare: node_set.prepare,
+            NodeControlKind.Command: node_set.command,
+            NodeControlKind.Response: node_set.response,
+            NodeControlKind.Condition: node_set.condition,
+        }
+        for node in nodes:
+            bucket = buckets.get(node.kind)
+            if bucket is not None:
+                bucket.append(node)
+        return node_set
 
+    @property
+    def commands(self) -> list[NodeControlBase]:
+        return self.prepare + self.command
 
-def _filter_nodes(
-    nodes: list[NodeControlBase], filter: list[NodeControlKind]
-) -> list[NodeControlBase]:
-    return [n for n in nodes if n.kind in filter]
+    @property
+    def responses(self) -> list[NodeControlBase]:
+        return self.command + self.response
+
+    @property
+    def conditions(self) -> list[NodeControlBase]:
+        return self.condition + self.command + self.response
 
 
 def filter_commands(nodes: list[NodeControlBase]) -> list[NodeControlBase]:
-    return _filter_nodes(nodes, [NodeControlKind.Prepare, NodeControlKind.Command])
+    return NodeControlSet.from_nodes(nodes).commands
 
 
 def filter_responses(nodes: list[NodeControlBase]) -> list[NodeControlBase]:
-    return _filter_nodes(nodes, [NodeControlKind.Command, NodeControlKind.Response])
+    return NodeControlSet.from_nodes(nodes).responses
 
 
 def filter_conditions(nodes: list[NodeControlBase]) -> list[NodeControlBase]:
-    return _filter_nodes(
-        nodes,
-        [NodeControlKind.Condition, NodeControlKind.Command, NodeControlKind.Response],
-    )
+    return NodeControlSet.from_nodes(nodes).conditions
@@ -3,9 +3,12 @@
 
 from __future__ import annotations
 
+import sys
 from collections import defaultdict
 from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import cached_property
+from itertools import groupby
 from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import numpy as np
@@ -51,6 +54,9 @@ HandleResultShapes = Dict[AcquireHandle, HandleResultShape]
 
 @dataclass(frozen=True)
 class AwgKey:
+    # Manual __slots__, as dataclass(slots=True) requires Python 3.10+
+    __slots__ = ("device_uid", "awg_index")
+
     device_uid: str
     awg_index: int
 
@@ -95,6 +101,10 @@ class RtExecutionInfo:
     # TODO(2K): to be replaced by event-based calculation in the compiler
     signal_result_map: Dict[str, List[str]] = field(default_factory=dict)
 
+    # handle -> signal reverse index over signal_result_map, built lazily and
+    # reset whenever signal_result_map is updated
+    _handle_to_signal: Optional[Dict[str, str]] = field(default=None, init=False)
+
     def add_acquire_section(self, signal_id: str, section_id: str):
         self.acquire_sections.setdefault(signal_id, set()).add(section_id)
 
@@ -110,14 +120,14 @@ class RtExecutionInfo:
         return acquisition_type
 
     def signal_by_handle(self, handle: str) -> Optional[str]:
-        return next(
-            (
-                signal
-                for signal, handles in self.signal_result_map.items()
-                if handle in handles
-            ),
-            None,
-        )
+        if self._handle_to_signal is None:
+            handle_to_signal: Dict[str, str] = {}
+            for signal, handles in self.signal_result_map.items():
+                for h in handles:
+                    if h is not None and h not in handle_to_signal:
+                        handle_to_signal[h] = signal
+            self._handle_to_signal = handle_to_signal
+        return self._handle_to_signal.get(handle)
 
 
 RtSectionId = str
@@ -141,16 +151,42 @@ class RecipeData:
         for initialization in self.recipe.experiment.initializations:
             yield initialization
 
+    @cached_property
+    def _initializations_by_device_uid(self) -> Dict[str, Initialization.Data]:
+        # The recipe is not mutated after pre-processing, safe to index once
+        return {i.device_uid: i for i in self.recipe.experiment.initializations}
+
     def get_initialization_by_device_uid(self, device_uid: str) -> Initialization.Data:
-        initialization: Initialization.Data
-        for initialization in self.initializations:
-            if initialization.device_uid == device_uid:
-                return initialization
+        return self._initializations_by_device_uid.get(device_uid)
+
+    @cached_property
+    def _waves_by_filename(self) -> Dict[str, Any]:
+        # Contiguize once up front, so repeated lookups of the same wave
+        # return a ready-to-upload array without re-checking the layout.
+        return {
+            wave["filename"]: np.ascontiguousarray(wave["samples"])
+            for wave in self.scheduled_experiment.waves or []
+            if "filename" in wave
+        }
+
+    def get_wave(self, wave_name: str) -> npt.ArrayLike:
+        wave = self._waves_by_filename.get(wave_name)
+        if wave is None:
+            raise LabOneQControllerException(
+                f"Wave '{wave_name}' is not found in the compiled waves collection."
+            )
+        return wave
+
+    @cached_property
+    def _awgs_producing_results(self) -> List[Tuple[AwgKey, AwgConfig]]:
+        return [
+            (awg_key, awg_config)
+            for awg_key, awg_config in self.awg_configs.items()
+            if awg_config.result_length is not None
+        ]
 
     def awgs_producing_results(self) -> Iterator[Tuple[AwgKey, AwgConfig]]:
-        for awg_key, awg_config in self.awg_configs.items():
-            if awg_config.result_length is not None:
-                yield awg_key, awg_config
+        return iter(self._awgs_producing_results)
 
     def awg_config_by_acquire_signal(self, signal_id: str) -> Optional[AwgConfig]:
         return next(
@@ -176,50 +212,57 @@ def _pre_process_iq_settings_hdawg(initialization: Initialization.Data):
 
     outputs = initialization.outputs
     awgs = initialization.awgs
-    iq_settings = {}
+    # (awg_idx, gains matrix) per I/Q pair - collected first, normalized in
+    # one batched NumPy pass instead of paying the array construction and
+    # norm dispatch per pair
+    iq_pairs: List[Tuple[int, List[List[float]]]] = []
+    considered_awgs: Set[int] = set()
+    outputs_by_channel = {o.channel: o for o in outputs or []}
+    awgs_by_index = {a.awg: a for a in awgs or []}
 
     for output in outputs or []:
         awg_idx = output.channel // 2
 
         # The channel already considered? Skip to the next.
-        if awg_idx in iq_settings:
+        if awg_idx in considered_awgs:
             continue
+        considered_awgs.add(awg_idx)
 
         # Do the outputs form an I/Q pair?
-        awg = next((a for a in awgs if a.awg == awg_idx), None)
+        awg = awgs_by_index.get(awg_idx)
         if awg is None or awg.signal_type != SignalType.IQ:
             continue
 
         # Determine I and Q output elements for the IQ pair with index awg_idxs.
+        # XOR with 1 toggles between the even (I) and odd (Q) pair channel.
+        partner = outputs_by_channel.get(output.channel ^ 1, IO.Data(0))
         if output.channel % 2 == 0:
-            i_out = output
-            q_out = next(
-                (o for o in outputs if o.channel == output.channel + 1), IO.Data(0)
-            )
+            i_out, q_out = output, partner
         else:
-            i_out = next(
-                (o for o in outputs if o.channel == output.channel - 1), IO.Data(0)
-            )
-            q_out = output
+            i_out, q_out = partner, output
 
         if i_out.gains is None or q_out.gains is None:
             continue  # No pair with valid gains found? This is not an IQ signal.
 
-        iq_mixer_calib_mx = np.array(
-            [
-                [i_out.gains.diagonal, q_out.gains.off_diagonal],
-                [i_out.gains.off_diagonal, q_out.gains.diagonal],
-            ]
+        iq_pairs.append(
+            (
+                awg_idx,
+                [
+                    [i_out.gains.diagonal, q_out.gains.off_diagonal],
+                    [i_out.gains.off_diagonal, q_out.gains.diagonal],
+                ],
+            )
         )
 
-        # Normalize resulting matrix to its inf-norm, to avoid clamping
-        iq_mixer_calib_normalized = iq_mixer_calib_mx / np.linalg.norm(
-            iq_mixer_calib_mx, np.inf
-        )
+    if len(iq_pairs) == 0:
+        return {}
 
-        iq_settings[awg_idx] = iq_mixer_calib_normalized
+    # Normalize each matrix to its inf-norm (max abs row sum), to avoid clamping
+    matrices = np.array([mx for _, mx in iq_pairs], dtype=np.float64)
+    inf_norms = np.abs(matrices).sum(axis=2).max(axis=1)
+    matrices /= inf_norms[:, None, None]
 
-    return iq_settings
+    return {awg_idx: matrices[k] for k, (awg_idx, _) in enumerate(iq_pairs)}
 
 
 @dataclass
@@ -251,9 +294,9 @@ class _ResultShapeCalculator(ExecutorBase):
         self._pipeline_index: int | None = None
 
     def _single_shot_axis(self) -> npt.ArrayLike:
-        return np.linspace(
-            0, self._current_rt_info.averages - 1, self._current_rt_info.averages
-        )
+        # Plain integer index vector [0 .. averages-1] - arange is a simple
+        # strided fill, keep float64 for axis consumers
+        return np.arange(self._current_rt_info.averages, dtype=np.float64)
 
     def acquire_handler(self, handle: str, signal: str, parent_uid: str):
         self._current_rt_info.add_acquire_section(signal, parent_uid)
@@ -262,23 +305,25 @@ class _ResultShapeCalculator(ExecutorBase):
         single_shot_cyclic = (
             self._current_rt_info.averaging_mode == AveragingMode.SINGLE_SHOT
         )
-        shape = [
-            loop.count
-            for loop in self._loop_stack
-            if not loop.is_averaging or single_shot_cyclic
-        ]
         known_shape = self.result_shapes.get(handle)
+        # Single pass over the loop stack; the axes are only needed when the
+        # handle is seen for the first time.
+        collect_axes = known_shape is None
+        shape: List[int] = []
+        axis_name: List[Union[str, List[str]]] = []
+        axis: List[Union[npt.ArrayLike, List[npt.ArrayLike]]] = []
+        # With cyclic single-shot averaging every loop contributes an axis,
+        # so the averaging filter applies only to the other modes.
+        if single_shot_cyclic:
+            loops = self._loop_stack
+        else:
+            loops = [loop for loop in self._loop_stack if not loop.is_averaging]
+        for loop in loops:
+            shape.append(loop.count)
+            if collect_axes:
+                axis_name.append(loop.axis_name)
+                axis.append(loop.axis)
         if known_shape is None:
-            axis_name = [
-                loop.axis_name
-                for loop in self._loop_stack
-                if not loop.is_averaging or single_shot_cyclic
-            ]
-            axis = [
-                loop.axis
-                for loop in self._loop_stack
-                if not loop.is_averaging or single_shot_cyclic
-            ]
             self.result_shapes[handle] = HandleResultShape(
                 base_shape=shape, base_axis_name=axis_name, base_axis=axis
             )
@@ -374,46 +419,58 @@ def _calculate_awg_configs(
 ) -> AwgConfigs:
     awg_configs: AwgConfigs = defaultdict(AwgConfig)
 
-    def awg_key_by_acquire_signal(signal_id: str) -> AwgKey:
-        return next(
-            awg_key
-            for awg_key, awg_config in awg_configs.items()
-            if signal_id in awg_config.acquire_signals
-        )
-
-    def integrator_index_by_acquire_signal(signal_id: str, is_local: bool) -> int:
-        integrator = next(
-            ia for ia in experiment.integrator_allocations if ia.signal_id == signal_id
-        )
-        # Only relevant for discrimination mode, where only one channel should
-        # be assigned (no multi-state as of now)
-        # TODO(2K): Check if HBAR-1359 affects also SHFQA / global feedback
-        return integrator.channels[0] * (2 if is_local else 1)
-
     for a in experiment.integrator_allocations:
-        awg_configs[AwgKey(a.device_id, a.awg)].acquire_signals.add(a.signal_id)
+        # Interning the device uid lets the many dict lookups keyed by it
+        # (directly or via AwgKey) short-circuit on string identity.
+        awg_configs[AwgKey(sys.intern(a.device_id), a.awg)].acquire_signals.add(
+            a.signal_id
+        )
 
     for initialization in experiment.initializations:
-        device_id = initialization.device_uid
+        device_id = sys.intern(initialization.device_uid)
         for awg in initialization.awgs or []:
             awg_config = awg_configs[AwgKey(device_id, awg.awg)]
             awg_config.qa_signal_id = awg.qa_signal_id
             awg_config.command_table_match_offset = awg.command_table_match_offset
             awg_config.target_feedback_register = awg.feedback_register
 
-    zsync_bits_allocation: Dict[str, int] = defaultdict(int)
+    # Lookup indexes replacing the former per-query linear scans
+    awg_key_by_acquire_signal: Dict[str, AwgKey] = {
+        signal: awg_key
+        for awg_key, awg_config in awg_configs.items()
+        for signal in awg_config.acquire_signals
+    }
+    integrator_by_acquire_signal = {
+        ia.signal_id: ia for ia in experiment.integrator_allocations
+    }
+    acquire_length_by_key = {
+        (al.signal_id, al.section_id): al.acquire_length
+        for al in experiment.acquire_lengths
+    }
+
+    need_zsync_bit: List[Tuple[AwgKey, AwgConfig]] = []
     for awg_key, awg_config in awg_configs.items():
         if awg_config.qa_signal_id is not None:
-            qa_awg_key = awg_key_by_acquire_signal(awg_config.qa_signal_id)
+            qa_awg_key = awg_key_by_acquire_signal[awg_config.qa_signal_id]
             feedback_register = awg_configs[qa_awg_key].target_feedback_register
             is_local = feedback_register is None
-            awg_config.feedback_register_bit = integrator_index_by_acquire_signal(
-                awg_config.qa_signal_id, is_local
+            integrator = integrator_by_acquire_signal[awg_config.qa_signal_id]
+            # Only relevant for discrimination mode, where only one channel
+            # should be assigned (no multi-state as of now)
+            # TODO(2K): Check if HBAR-1359 affects also SHFQA / global feedback
+            awg_config.feedback_register_bit = integrator.channels[0] * (
+                2 if is_local else 1
             )
             if not is_local:
                 awg_config.source_feedback_register = feedback_register
-                awg_config.zsync_bit = zsync_bits_allocation[awg_key.device_uid]
-                zsync_bits_allocation[awg_key.device_uid] += 1
+                need_zsync_bit.append((awg_key, awg_config))
+
+    # Assign zsync bits per device in (device_uid, awg_index) order, making
+    # the allocation explicit instead of relying on awg_configs insertion order.
+    need_zsync_bit.sort(key=lambda item: (item[0].device_uid, item[0].awg_index))
+    for _, device_group in groupby(need_zsync_bit, key=lambda item: item[0].device_uid):
+        for zsync_bit, (_, awg_config) in enumerate(device_group):
+            awg_config.zsync_bit = zsync_bit
 
     # As currently just a single RT execution per experiment is supported,
     # AWG configs are not cloned per RT execution. May need to be changed in the future.
@@ -423,16 +480,13 @@ def _calculate_awg_configs(
         # device_id -> set of raw acquisition lengths
         raw_acquire_lengths: Dict[str, Set[int]] = {}
         for signal, sections in rt_execution_info.acquire_sections.items():
-            awg_key = awg_key_by_acquire_signal(signal)
+            awg_key = awg_key_by_acquire_signal[signal]
             for section in sections:
-                for acquire_length_info in experiment.acquire_lengths:
-                    if (
-                        acquire_length_info.signal_id == signal
-                        and acquire_length_info.section_id == section
-                    ):
-                        raw_acquire_lengths.setdefault(awg_key.device_uid, set()).add(
-                            acquire_length_info.acquire_length
-                        )
+                acquire_length = acquire_length_by_key.get((signal, section))
+                if acquire_length is not None:
+                    raw_acquire_lengths.setdefault(awg_key.device_uid, set()).add(
+                        acquire_length
+                    )
         for device_id, awg_raw_acquire_lengths in raw_acquire_lengths.items():
             if len(awg_raw_acquire_lengths) > 1:
                 raise LabOneQControllerException(
@@ -453,12 +507,15 @@ def _calculate_awg_configs(
             # regardless of the given integrators mask. Masked-out integrators just leave the
             # value at NaN (corresponds to None in the map).
             awg_result_map: Dict[str, List[str]] = defaultdict(list)
+            acquire_signals = awg_config.acquire_signals
             for acquires in experiment.simultaneous_acquires:
-                if any(signal in acquires for signal in awg_config.acquire_signals):
-                    for signal in awg_config.acquire_signals:
+                # C-level set intersection instead of per-signal membership tests
+                if acquire_signals & acquires.keys():
+                    for signal in acquire_signals:
                         awg_result_map[signal].append(acquires.get(signal))
             if len(awg_result_map) > 0:
                 rt_execution_info.signal_result_map.update(awg_result_map)
+                rt_execution_info._handle_to_signal = None
                 # All lengths are the same, see comment above.
                 any_awg_signal_result_map = next(iter(awg_result_map.values()))
                 mapping_repeats = (
@@ -478,12 +535,15 @@ def _pre_process_attributes(
 ) -> tuple[AttributeValueTracker, list[str]]:
     attribute_value_tracker = AttributeValueTracker()
     oscillator_ids: list[str] = []
+    # Parallel {id: index} map, keeping both the membership test and the
+    # index lookup O(1) instead of scanning oscillator_ids.
+    osc_id_to_index: dict[str, int] = {}
     oscillators_check: dict[str, str | float] = {}
 
     for oscillator_param in experiment.oscillator_params:
         value_or_param = oscillator_param.param or oscillator_param.frequency
-        if oscillator_param.id in oscillator_ids:
-            osc_index = oscillator_ids.index(oscillator_param.id)
+        osc_index = osc_id_to_index.get(oscillator_param.id)
+        if osc_index is not None:
             if oscillators_check[oscillator_param.id] != value_or_param:
                 raise LabOneQControllerException(
                     f"Conflicting specifications for the same oscillator id '{oscillator_param.id}' "
@@ -492,9 +552,10 @@ def _pre_process_attributes(
         else:
             osc_index = len(oscillator_ids)
             oscillator_ids.append(oscillator_param.id)
+            osc_id_to_index[oscillator_param.id] = osc_index
             oscillators_check[oscillator_param.id] = value_or_param
         attribute_value_tracker.add_attribute(
-            device_uid=oscillator_param.device_id,
+            device_uid=sys.intern(oscillator_param.device_id),
             attribute=DeviceAttribute(
                 name=AttributeName.OSCILLATOR_FREQ,
                 index=osc_index,
@@ -503,10 +564,11 @@ def _pre_process_attributes(
         )
 
     for initialization in experiment.initializations:
-        device = devices.find_by_uid(initialization.device_uid)
+        device_uid = sys.intern(initialization.device_uid)
+        device = devices.find_by_uid(device_uid)
         for attribute in device.pre_process_attributes(initialization):
             attribute_value_tracker.add_attribute(
-                device_uid=initialization.device_uid,
+                device_uid=device_uid,
                 attribute=attribute,
             )
 
@@ -522,12 +584,13 @@ def pre_process_compiled(
 
     device_settings: DeviceSettings = defaultdict(DeviceRecipeData)
     for initialization in recipe.experiment.initializations:
-        device_settings[initialization.device_uid] = DeviceRecipeData(
+        device_settings[sys.intern(initialization.device_uid)] = DeviceRecipeData(
             iq_settings=_pre_process_iq_settings_hdawg(initialization)
         )
 
     result_shapes, rt_execution_infos = _calculate_result_shapes(execution)
-    awg_configs = _calculate_awg_configs(rt_execution_infos, recipe.experiment)
+    # Freeze into a plain dict - no config may be implicitly added past this point
+    awg_configs = dict(_calculate_awg_configs(rt_execution_infos, recipe.experiment))
     attribute_value_tracker, oscillator_ids = _pre_process_attributes(
         recipe.experiment, devices
     )
@@ -3,21 +3,17 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
 import numpy as np
 from numpy.typing import ArrayLike
 
 from laboneq.controller.recipe_enums import NtStepKey
-
-if TYPE_CHECKING:
-    from laboneq.dsl.result.acquired_result import AcquiredResult
-    from laboneq.dsl.result.results import Results
+from laboneq.dsl.result.acquired_result import AcquiredResult
+from laboneq.dsl.result.results import Results
 
 
 def make_empty_results() -> Results:
-    from laboneq.dsl.result.results import Results
-
     return Results(acquired_results={}, user_func_results={}, execution_errors=[])
 
 
@@ -26,8 +22,6 @@ def make_acquired_result(
     axis_name: list[str | list[str]],
     axis: list[ArrayLike | list[ArrayLike]],
 ) -> AcquiredResult:
-    from laboneq.dsl.result.acquired_result import AcquiredResult
-
     return AcquiredResult(data, axis_name, axis)
 
 
@@ -39,22 +33,28 @@ def build_partial_result(
     handle: str,
 ):
     result.last_nt_step = list(nt_step.indices)
-    if len(np.shape(result.data)) == len(nt_step.indices):
+    # The mapping repeats cyclically over raw_result - compute the positions
+    # matching the handle once as a boolean mask instead of testing every
+    # element in a Python loop. The gather below then runs entirely at C
+    # speed on the contiguous raw vector.
+    raw = np.ascontiguousarray(raw_result)
+    mask_unit = np.fromiter(
+        (m == handle for m in mapping), dtype=bool, count=len(mapping)
+    )
+    nt_step_depth = len(nt_step.indices)
+    if np.ndim(result.data) == nt_step_depth:
         # No loops in RT, just a single value produced
-        for raw_result_idx in range(len(raw_result)):
-            if mapping[raw_result_idx % len(mapping)] == handle:
-                if len(nt_step.indices) == 0:
-                    result.data = raw_result[raw_result_idx]
-                else:
-                    result.data[nt_step.indices] = raw_result[raw_result_idx]
-                break
+        match_positions = np.flatnonzero(np.resize(mask_unit, len(raw)))
+        if len(match_positions) > 0:
+            value = raw[match_positions[0]]
+            if nt_step_depth == 0:
+                result.data = value
+            else:
+                result.data[nt_step.indices] = value
     else:
         inner_res = result.data
         for index in nt_step.indices:
             inner_res = inner_res[index]
         res_flat = np.ravel(inner_res)
-        res_flat_idx = 0
-        for raw_result_idx in range(len(raw_result)):
-            if mapping[raw_result_idx % len(mapping)] == handle:
-                res_flat[res_flat_idx] = raw_result[raw_result_idx]
-                res_flat_idx += 1
+        matched = raw[np.resize(mask_unit, len(raw))]
+        res_flat[: len(matched)] = matched
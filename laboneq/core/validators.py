@@ -21,13 +21,16 @@ def assert_args_not_ambiguous(
 def validating_allowed_values(allowed_values: Dict[str, Any]):
     def f(cls):
         orig_setattr = cls.__setattr__
+        # The vast majority of assignments touch non-validated fields - use a
+        # dict probe instead of raising and catching a KeyError for them. The
+        # allowed values stay in tuples, keeping plain equality semantics.
+        validated = {prop: tuple(vals) for prop, vals in allowed_values.items()}
+        get_allowed = validated.get
 
         def __setattr__(self, prop, val):
-            try:
-                if val is not None and val not in allowed_values[prop]:
-                    raise ValueError(f"Setting {prop} to {val} is not allowed.")
-            except KeyError:
-                pass
+            allowed = get_allowed(prop)
+            if allowed is not None and val is not None and val not in allowed:
+                raise ValueError(f"Setting {prop} to {val} is not allowed.")
             orig_setattr(self, prop, val)
 
         cls.__setattr__ = __setattr__
@@ -9,16 +9,16 @@ from laboneq.dsl.dsl_dataclass_decorator import classformatter
 
 
 def _sanitize_key(key: Any) -> str:
-    try:
-        return key.path
-    except AttributeError as error:
-        if not isinstance(key, str):
-            raise TypeError("Key must be a string.") from error
-        return key
+    # Plain strings are the common case - getattr avoids the cost of raising
+    # and catching an AttributeError for them.
+    key = getattr(key, "path", key)
+    if not isinstance(key, str):
+        raise TypeError("Key must be a string.")
+    return key
 
 
 @classformatter
-@dataclass(init=True, repr=True, order=True)
+@dataclass(init=True, repr=True)
 class Calibration:
     """Calibration object containing a dict of :class:`~.CalibrationItem`.
 
@@ -24,7 +24,7 @@ def oscillator_uid_generator():
 
 
 @classformatter
-@dataclass(init=True, repr=True, order=True)
+@dataclass(init=True, repr=True)
 class Oscillator:
     """
     This oscillator class represents an oscillator on a `PhysicalChannel`.
@@ -11,23 +11,31 @@ from ...enums import IOSignalType
 from .zi_standard_instrument import ZIStandardInstrument
 
 
+def _build_ports():
+    return [
+        Port(
+            IODirection.OUT,
+            uid=f"PPCHANNELS/{ch}",
+            signal_type=IOSignalType.PPC,
+            physical_port_ids=[f"{ch}"],
+            connector_labels=[f"Signal Output {ch+1}"],
+        )
+        for ch in range(4)
+    ]
+
+
+# The port list is identical for every SHFPPC instance - build it once at
+# module level. A cached_property would leak the list into the instance
+# __dict__ and thus into the serialized representation.
+_PORTS = _build_ports()
+
+
 @classformatter
-@dataclass(init=True, repr=True, order=True)
+@dataclass(init=True, repr=True)
 class SHFPPC(ZIStandardInstrument):
     """Class representing a ZI SHFPPC instrument."""
 
     @property
     def ports(self):
         """Ports that are part of this instrument."""
-        outputs = []
-        for ch in range(4):
-            outputs.append(
-                Port(
-                    IODirection.OUT,
-                    uid=f"PPCHANNELS/{ch}",
-                    signal_type=IOSignalType.PPC,
-                    physical_port_ids=[f"{ch}"],
-                    connector_labels=[f"Signal Output {ch+1}"],
-                )
-            )
-        return outputs
+        return list(_PORTS)
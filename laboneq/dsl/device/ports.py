@@ -9,7 +9,7 @@ from laboneq.dsl.dsl_dataclass_decorator import classformatter
 
 
 @classformatter
-@dataclass(init=True, repr=True, order=True)
+@dataclass(init=True, repr=True)
 class Port:
     """Abstraction of a port"""
 
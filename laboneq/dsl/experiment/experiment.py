@@ -824,7 +824,7 @@ class Experiment:
             sections = self.sections
         for section in sections:
             visitor(section)
-            self.accept_section_visitor(visitor, section.sections)
+            self.accept_section_visitor(visitor, section.iter_sections())
 
     def match_local(
         self,
@@ -1011,7 +1011,7 @@ class Experiment:
     @staticmethod
     def _all_subsections(section):
         retval = [section]
-        for s in section.sections:
+        for s in section.iter_sections():
             retval.extend(Experiment._all_subsections(s))
 
         return retval
@@ -3,8 +3,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+import sys
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from laboneq import dsl
 from laboneq.core.exceptions import LabOneQException
@@ -26,12 +27,24 @@ from .operation import Operation
 from .play_pulse import PlayPulse
 from .reserve import Reserve
 from .set import Set
-from .utils import id_generator
+from .utils import id_counter
 
 if TYPE_CHECKING:
     from .. import Parameter
 
+# Bulk experiment construction creates thousands of sections - use the bound
+# category counter instead of going through id_generator for each uid.
+_section_uid_next = id_counter("s")
 
+# Exact types accepted as Case children - checked by pointer compare before
+# falling back to isinstance for subclasses.
+_CASE_ALLOWED_CHILDREN = frozenset({PlayPulse, Delay})
+
+
+# TODO(2K): Evaluate @dataclass(slots=True) for Section and its subclasses once
+# Python 3.10 is the minimum version. Manual __slots__ is not an option here:
+# it conflicts with the defaulted dataclass fields on 3.9, and both the
+# serializer and Case.from_section rely on the instance __dict__.
 @classformatter
 @dataclass(init=True, repr=True, order=True)
 class Section:
@@ -72,7 +85,13 @@ class Section:
 
     def __post_init__(self):
         if self.uid is None:
-            self.uid = id_generator("s")
+            self.uid = f"_s_{_section_uid_next()}"
+        elif isinstance(self.uid, str):
+            # Uids and trigger signals key many dicts in the compiler passes -
+            # intern them so those lookups compare by pointer identity.
+            self.uid = sys.intern(self.uid)
+        if self.trigger:
+            self.trigger = {sys.intern(k): v for k, v in self.trigger.items()}
 
     def add(self, section: Union[Section, Operation, Set]):
         """Add a subsection or operation to the section.
@@ -82,17 +101,53 @@ class Section:
         """
         self.children.append(section)
 
+    def add_many(self, items: List[Union[Section, Operation, Set]]):
+        """Add several subsections or operations at once.
+
+        Args:
+            items: Items that are added.
+        """
+        if type(self).add is Section.add:
+            self.children.extend(items)
+        else:
+            # Subclasses validate in add - go through it per item.
+            for item in items:
+                self.add(item)
+
+    def _filtered_children(self, cache_key: str, child_type: type) -> tuple:
+        # Compiler passes read these views repeatedly - cache the filtered
+        # tuple and rebuild only when the children list was replaced or grew.
+        cache = self.__dict__.get(cache_key)
+        children = self.children
+        if cache is not None and cache[0] is children and cache[1] == len(children):
+            return cache[2]
+        filtered = tuple([s for s in children if isinstance(s, child_type)])
+        setattr(self, cache_key, (children, len(children), filtered))
+        return filtered
+
+    def iter_sections(self) -> Iterator[Section]:
+        """Iterate over the subsections without materializing a tuple."""
+        for child in self.children:
+            if isinstance(child, Section):
+                yield child
+
+    def iter_operations(self) -> Iterator[Operation]:
+        """Iterate over the operations without materializing a tuple."""
+        for child in self.children:
+            if isinstance(child, Operation):
+                yield child
+
     @property
     def sections(self) -> Tuple[Section]:
         """A list of subsections of this section"""
-        return tuple([s for s in self.children if isinstance(s, Section)])
+        return self._filtered_children("_sections_cache", Section)
 
     @property
     def operations(self) -> Tuple[Operation]:
         """A list of operations in the section.
 
         Note that there may be other children of a section which are not operations but subsections."""
-        return tuple([s for s in self.children if isinstance(s, Operation)])
+        return self._filtered_children("_operations_cache", Operation)
 
     def set(self, path: str, value: Any):
         """Set the value of an instrument node.
@@ -101,7 +156,7 @@ class Section:
             path: Path to the node whose value should be set.
             value: Value that should be set.
         """
-        self.add(Set(path=path, value=value))
+        self.add(Set(path=sys.intern(path), value=value))
 
     def play(
         self,
@@ -226,41 +281,45 @@ class Section:
         if not isinstance(acquire_signal, str):
             raise TypeError("`acquire_signal` must be a string.")
 
+        # Collect the operations and append them in one go.
+        ops: List[Operation] = []
         if measure_signal is None:
-            self.acquire(
-                signal=acquire_signal,
-                handle=handle,
-                length=integration_length,
+            ops.append(
+                Acquire(
+                    signal=acquire_signal,
+                    handle=handle,
+                    length=integration_length,
+                )
             )
 
         elif isinstance(measure_signal, str):
-            self.play(
-                signal=measure_signal,
-                pulse=measure_pulse,
-                amplitude=measure_pulse_amplitude,
-                length=measure_pulse_length,
-                pulse_parameters=measure_pulse_parameters,
+            ops.append(
+                PlayPulse(
+                    measure_signal,
+                    measure_pulse,
+                    amplitude=measure_pulse_amplitude,
+                    length=measure_pulse_length,
+                    pulse_parameters=measure_pulse_parameters,
+                )
             )
 
             if acquire_delay is not None:
-                self.delay(
+                ops.append(Delay(signal=acquire_signal, time=acquire_delay))
+
+            ops.append(
+                Acquire(
                     signal=acquire_signal,
-                    time=acquire_delay,
+                    handle=handle,
+                    kernel=integration_kernel,
+                    length=integration_length,
+                    pulse_parameters=integration_kernel_parameters,
                 )
-
-            self.acquire(
-                signal=acquire_signal,
-                handle=handle,
-                kernel=integration_kernel,
-                length=integration_length,
-                pulse_parameters=integration_kernel_parameters,
             )
 
         if reset_delay is not None:
-            self.delay(
-                signal=acquire_signal,
-                time=reset_delay,
-            )
+            ops.append(Delay(signal=acquire_signal, time=reset_delay))
+
+        self.add_many(ops)
 
     def delay(
         self,
@@ -365,14 +424,24 @@ class Match(Section):
         Args:
             case: Branch that is added.
         """
-        if not isinstance(case, Case):
+        # Exact-type pointer compare first; the isinstance fallback keeps
+        # subclasses of Case working.
+        if type(case) is not Case and not isinstance(case, Case):
             raise LabOneQException(
                 f"Trying to add section to section {self.uid} which is not of type 'Case'."
             )
-        if any(c.state == case.state for c in self.sections):
+        # Side index of the branch states seen so far, so the duplicate check
+        # is O(1) instead of re-scanning all children per added branch. Built
+        # lazily to also cover children appended directly to the list.
+        case_states = self.__dict__.get("_match_case_states")
+        if case_states is None:
+            case_states = {c.state for c in self.children if isinstance(c, Case)}
+            self._match_case_states = case_states
+        if case.state in case_states:
             raise LabOneQException(
                 f"A branch which matches {case.state} already exists."
             )
+        case_states.add(case.state)
         super().add(case)
 
 
@@ -390,7 +459,9 @@ class Case(Section):
     state: int = 0
 
     def add(self, obj):
-        if not isinstance(obj, (PlayPulse, Delay)):
+        if type(obj) not in _CASE_ALLOWED_CHILDREN and not isinstance(
+            obj, (PlayPulse, Delay)
+        ):
             raise LabOneQException(
                 f"Trying to add object to section {self.uid}. Only ``play`` and ``delay`` are allowed."
             )
@@ -399,4 +470,11 @@ class Case(Section):
     @classmethod
     def from_section(cls, section, state):
         """Down-cast from Section."""
-        return cls(**section.__dict__, state=state)  # type: ignore
+        # Copy the declared fields only - the instance dict may also hold
+        # internal caches - and skip __init__/__post_init__, which would
+        # needlessly regenerate a uid just to overwrite it.
+        obj = cls.__new__(cls)
+        for f in fields(section):
+            setattr(obj, f.name, getattr(section, f.name))
+        obj.state = state
+        return obj
@@ -11,3 +11,12 @@ def id_generator(cat: str = "") -> str:
     """Incremental IDs for each category."""
     global _iid_map
     return f"_{cat}_{next(_iid_map[cat])}"
+
+
+def id_counter(cat: str = ""):
+    """Bound counter of a category for hot uid generation paths.
+
+    Shares the counters with :func:`id_generator`, but skips the per-call
+    dict lookup - the returned callable is a C-level increment.
+    """
+    return _iid_map[cat].__next__
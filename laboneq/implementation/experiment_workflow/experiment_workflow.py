@@ -1,8 +1,8 @@
 # Copyright 2020 Zurich Instruments AG
 # SPDX-License-Identifier: Apache-2.0
 
-import copy
 import logging
+import pickle
 from typing import Dict
 
 from laboneq.data.data_helper import DataHelper
@@ -22,6 +22,18 @@ from laboneq.interfaces.runner.runner_control_api import RunnerControlAPI
 _logger = logging.getLogger(__name__)
 
 
+def _clone(obj):
+    """Deep clone of a data object graph.
+
+    Round-tripping through pickle is considerably faster than copy.deepcopy
+    on the plain dataclass trees handled here, as it avoids the per-node
+    memo bookkeeping and reflective dispatch of deepcopy.
+    """
+    if obj is None:
+        return None
+    return pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
 class ExperimentWorkflow(ExperimentAPI):
     def __init__(
         self,
@@ -38,10 +50,18 @@ class ExperimentWorkflow(ExperimentAPI):
         self._settings = settings
         self._current_experiment = None
         self._signal_mappings = None
+        self._logical_signals_by_path = None
 
         if id(self._runner_control) != id(self._runner):
             raise ValueError("RunnerControl and Runner must be the same object")
 
+    @staticmethod
+    def _ensure_uids(obj):
+        """Generate missing uids once per object, skipping repeated walks."""
+        if obj is not None and not getattr(obj, "_uids_generated", False):
+            DataHelper.generate_uids(obj)
+            obj._uids_generated = True
+
     def load_setup(
         self, setup_descriptor, server_host=None, server_port=None, setup_name=None
     ):
@@ -51,12 +71,13 @@ class ExperimentWorkflow(ExperimentAPI):
         self._current_setup = self.device_setup_from_descriptor(
             setup_descriptor, server_host, server_port, setup_name
         )
+        self._logical_signals_by_path = None
 
     def current_setup(self):
         """
         Get the current setup.
         """
-        return copy.deepcopy(self._current_setup)
+        return _clone(self._current_setup)
 
     def new_experiment(self) -> Experiment:
         """
@@ -64,13 +85,13 @@ class ExperimentWorkflow(ExperimentAPI):
         """
         self._current_experiment = Experiment(uid="exp" + str(self._experiment_counter))
         self._experiment_counter += 1
-        return copy.deepcopy(self._current_experiment)
+        return _clone(self._current_experiment)
 
     def current_experiment(self):
         """
         Get the current experiment
         """
-        return copy.deepcopy(self._current_experiment)
+        return _clone(self._current_experiment)
 
     def run_current_experiment(self, setup: Setup, signal_mappings: Dict[str, str]):
         """
@@ -82,7 +103,6 @@ class ExperimentWorkflow(ExperimentAPI):
         execution_payload: ExecutionPayload = (
             self.build_payload_for_current_experiment()
         )
-        DataHelper.generate_uids(execution_payload)
 
         job_id = self._runner.submit_execution_payload(execution_payload)
         return self._runner.run_job_result(job_id)
@@ -107,16 +127,18 @@ class ExperimentWorkflow(ExperimentAPI):
             self._current_setup, self._current_experiment, self._signal_mappings
         )
 
-        DataHelper.generate_uids(execution_payload)
+        self._ensure_uids(execution_payload)
 
-        return copy.deepcopy(execution_payload)
+        # The payload was freshly built above and is not stored on self -
+        # no defensive copy needed.
+        return execution_payload
 
     def set_current_experiment(self, experiment: Experiment):
         """
         Set the current experiment.
         """
-        self._current_experiment = copy.deepcopy(experiment)
-        DataHelper.generate_uids(self._current_experiment)
+        self._current_experiment = _clone(experiment)
+        self._ensure_uids(self._current_experiment)
 
     def device_setup_from_descriptor(
         self,
@@ -139,9 +161,14 @@ class ExperimentWorkflow(ExperimentAPI):
     def set_current_setup(self, setup: Setup):
         """
         Set the current setup.
+
+        The setup is stored by reference and must not be mutated by the
+        caller afterwards. No workflow method mutates it beyond filling in
+        missing uids, and current_setup() hands out copies.
         """
-        self._current_setup = copy.deepcopy(setup)
-        DataHelper.generate_uids(self._current_setup)
+        self._current_setup = setup
+        self._logical_signals_by_path = None
+        self._ensure_uids(self._current_setup)
         if self._settings.runner_is_local:
             _logger.info(f"Experiment runner is local, connecting to {setup.uid}")
             target_setup = self._payload_builder.convert_to_target_setup(setup)
@@ -155,18 +182,22 @@ class ExperimentWorkflow(ExperimentAPI):
         """
         Map experiment signals to logical signals.
         """
-        self._signal_mappings = {}
-        logical_signals_by_path = {
-            ls[1].path: ls[1]
-            for ls in SetupHelper.flat_logical_signals(self._current_setup)
-        }
+        # Rebuilt only when the setup changes - repeated remapping against
+        # the same setup reuses the index.
+        logical_signals_by_path = self._logical_signals_by_path
+        if logical_signals_by_path is None:
+            logical_signals_by_path = {
+                ls[1].path: ls[1]
+                for ls in SetupHelper.flat_logical_signals(self._current_setup)
+            }
+            self._logical_signals_by_path = logical_signals_by_path
         _logger.info(
             f"Mapping signals, experiment signals: {self._current_experiment.signals}"
         )
         experiment_signals_by_uid = {
             es.uid: es for es in self._current_experiment.signals
         }
-        for k, v in signal_mappings.items():
-            experiment_signal = experiment_signals_by_uid[k]
-            logical_signal = logical_signals_by_path[v]
-            self._signal_mappings[experiment_signal.uid] = logical_signal.path
+        self._signal_mappings = {
+            experiment_signals_by_uid[k].uid: logical_signals_by_path[v].path
+            for k, v in signal_mappings.items()
+        }
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import functools
 from typing import Any as AnyDSL
 
 from laboneq.core.types.enums.io_direction import IODirection as IODirectionDSL
@@ -66,147 +67,81 @@ from laboneq.implementation.legacy_adapters.dynamic_converter import convert_dyn
 from .post_process_setup_description import post_process
 
 
-def get_converter_function_setup_description(orig):
-    converter_function_directory = {
-        ConnectionDSL: convert_Connection,
-        DataServerDSL: convert_DataServer,
-        DeviceSetupDSL: convert_DeviceSetup,
-        HDAWGDSL: convert_HDAWG,
-        InstrumentDSL: convert_Instrument,
-        LogicalSignalDSL: convert_LogicalSignal,
-        LogicalSignalGroupDSL: convert_LogicalSignalGroup,
-        PQSCDSL: convert_PQSC,
-        PhysicalChannelDSL: convert_PhysicalChannel,
-        PortDSL: convert_Port,
-        QuantumElementDSL: convert_QuantumElement,
-        QubitDSL: convert_Qubit,
-        SHFQADSL: convert_SHFQA,
-        SHFSGDSL: convert_SHFSG,
-        ServerDSL: convert_Server,
-        UHFQADSL: convert_UHFQA,
-    }
-    return converter_function_directory.get(orig)
+def _converter(build):
+    """Fold the None passthrough and the post_process step shared by all
+    object converters around the given target-building function."""
 
+    @functools.wraps(build)
+    def convert(orig):
+        if orig is None:
+            return None
+        return post_process(
+            orig,
+            build(orig),
+            conversion_function_lookup=get_converter_function_setup_description,
+        )
 
+    return convert
+
+
+# Enum classes already keep a name-to-member dict (__members__), so indexing
+# the target enum by name replaces the per-call linear scan over the members.
 def convert_IODirection(orig: IODirectionDSL):
-    return (
-        next(e for e in IODirectionDATA if e.name == orig.name)
-        if orig is not None
-        else None
-    )
+    return IODirectionDATA[orig.name] if orig is not None else None
 
 
 def convert_IOSignalType(orig: IOSignalTypeDSL):
-    return (
-        next(e for e in IOSignalTypeDATA if e.name == orig.name)
-        if orig is not None
-        else None
-    )
+    return IOSignalTypeDATA[orig.name] if orig is not None else None
 
 
 def convert_PhysicalChannelType(orig: PhysicalChannelTypeDSL):
-    return (
-        next(e for e in PhysicalChannelTypeDATA if e.name == orig.name)
-        if orig is not None
-        else None
-    )
+    return PhysicalChannelTypeDATA[orig.name] if orig is not None else None
 
 
 def convert_PortMode(orig: PortModeDSL):
-    return (
-        next(e for e in PortModeDATA if e.name == orig.name)
-        if orig is not None
-        else None
-    )
+    return PortModeDATA[orig.name] if orig is not None else None
 
 
 def convert_ReferenceClockSource(orig: ReferenceClockSourceDSL):
-    return (
-        next(e for e in ReferenceClockSourceDATA if e.name == orig.name)
-        if orig is not None
-        else None
-    )
+    return ReferenceClockSourceDATA[orig.name] if orig is not None else None
 
 
+@_converter
 def convert_Connection(orig: ConnectionDSL):
-    if orig is None:
-        return None
-    retval = ConnectionDATA()
-    return post_process(
-        orig,
-        retval,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
+    return ConnectionDATA()
 
 
+@_converter
 def convert_DataServer(orig: DataServerDSL):
-    if orig is None:
-        return None
     retval = DataServerDATA()
     retval.api_level = orig.api_level
     retval.host = orig.host
     retval.leader_uid = orig.leader_uid
-    retval.port = convert_dynamic(
-        orig.port,
-        source_type_hint=AnyDSL,
-        target_type_hint=AnyDATA,
-        orig_is_collection=False,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
+    retval.port = _convert_any(orig.port)
     retval.uid = orig.uid
-    return post_process(
-        orig,
-        retval,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
+    return retval
 
 
+@_converter
 def convert_DeviceSetup(orig: DeviceSetupDSL):
-    if orig is None:
-        return None
     retval = DeviceSetupDATA()
-    retval.instruments = convert_dynamic(
-        orig.instruments,
-        source_type_hint=InstrumentDSL,
-        target_type_hint=InstrumentDATA,
-        orig_is_collection=True,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
-    retval.logical_signal_groups = convert_dynamic(
-        orig.logical_signal_groups,
-        source_type_hint=LogicalSignalGroupDSL,
-        target_type_hint=LogicalSignalGroupDATA,
-        orig_is_collection=True,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
-    retval.servers = convert_dynamic(
-        orig.servers,
-        source_type_hint=DataServerDSL,
-        target_type_hint=ServerDATA,
-        orig_is_collection=True,
-        conversion_function_lookup=get_converter_function_setup_description,
+    retval.instruments = _convert_instruments(orig.instruments)
+    retval.logical_signal_groups = _convert_logical_signal_groups(
+        orig.logical_signal_groups
     )
+    retval.servers = _convert_servers(orig.servers)
     retval.uid = orig.uid
     retval.calibration = orig.get_calibration()
-    return post_process(
-        orig,
-        retval,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
+    return retval
 
 
-def convert_HDAWG(orig: HDAWGDSL):
-    if orig is None:
-        return None
-    retval = HDAWGDATA()
-    retval.address = orig.address
-    retval.connections = convert_dynamic(
-        orig.connections,
-        source_type_hint=ConnectionDSL,
-        target_type_hint=ConnectionDATA,
-        orig_is_collection=True,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
+def _convert_instrument_like(orig, data_cls, copy_address=True):
+    # Shared body of all instrument converters - they only differ in the
+    # target class and whether the DSL type carries an address.
+    retval = data_cls()
+    if copy_address:
+        retval.address = orig.address
+    retval.connections = _convert_connections(orig.connections)
     retval.interface = orig.interface
     retval.uid = orig.uid
     return post_process(
@@ -216,200 +151,150 @@ def convert_HDAWG(orig: HDAWGDSL):
     )
 
 
+def convert_HDAWG(orig: HDAWGDSL):
+    return None if orig is None else _convert_instrument_like(orig, HDAWGDATA)
+
+
 def convert_Instrument(orig: InstrumentDSL):
     if orig is None:
         return None
-    retval = InstrumentDATA()
-    retval.connections = convert_dynamic(
-        orig.connections,
-        source_type_hint=ConnectionDSL,
-        target_type_hint=ConnectionDATA,
-        orig_is_collection=True,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
-    retval.interface = orig.interface
-    retval.uid = orig.uid
-    return post_process(
-        orig,
-        retval,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
+    return _convert_instrument_like(orig, InstrumentDATA, copy_address=False)
 
 
+@_converter
 def convert_LogicalSignal(orig: LogicalSignalDSL):
-    if orig is None:
-        return None
     retval = LogicalSignalDATA()
     retval.direction = convert_IODirection(orig.direction)
     retval.name = orig.name
     retval.path = orig.path
     retval.uid = orig.uid
-    return post_process(
-        orig,
-        retval,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
+    return retval
 
 
+@_converter
 def convert_LogicalSignalGroup(orig: LogicalSignalGroupDSL):
-    if orig is None:
-        return None
     retval = LogicalSignalGroupDATA()
-    retval.logical_signals = convert_dynamic(
-        orig.logical_signals,
-        source_type_string="Dict",
-        target_type_string="Dict[str,LogicalSignal]",
-        orig_is_collection=True,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
+    retval.logical_signals = _convert_logical_signals(orig.logical_signals)
     retval.uid = orig.uid
-    return post_process(
-        orig,
-        retval,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
+    return retval
 
 
 def convert_PQSC(orig: PQSCDSL):
-    if orig is None:
-        return None
-    retval = PQSCDATA()
-    retval.address = orig.address
-    retval.connections = convert_dynamic(
-        orig.connections,
-        source_type_hint=ConnectionDSL,
-        target_type_hint=ConnectionDATA,
-        orig_is_collection=True,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
-    retval.interface = orig.interface
-    retval.uid = orig.uid
-    return post_process(
-        orig,
-        retval,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
+    return None if orig is None else _convert_instrument_like(orig, PQSCDATA)
 
 
+@_converter
 def convert_PhysicalChannel(orig: PhysicalChannelDSL):
-    if orig is None:
-        return None
     retval = PhysicalChannelDATA()
     retval.type = convert_PhysicalChannelType(orig.type)
     retval.uid = orig.uid
-    return post_process(
-        orig,
-        retval,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
+    return retval
 
 
+@_converter
 def convert_Port(orig: PortDSL):
-    if orig is None:
-        return None
-    retval = PortDATA()
-    return post_process(
-        orig,
-        retval,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
+    return PortDATA()
 
 
+@_converter
 def convert_QuantumElement(orig: QuantumElementDSL):
-    if orig is None:
-        return None
     retval = QuantumElementDATA()
     retval.parameters = orig.parameters
     retval.signals = orig.signals
     retval.uid = orig.uid
-    return post_process(
-        orig,
-        retval,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
+    return retval
 
 
+@_converter
 def convert_Qubit(orig: QubitDSL):
-    if orig is None:
-        return None
-    retval = QubitDATA()
-    return post_process(
-        orig,
-        retval,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
+    return QubitDATA()
 
 
 def convert_SHFQA(orig: SHFQADSL):
-    if orig is None:
-        return None
-    retval = SHFQADATA()
-    retval.address = orig.address
-    retval.connections = convert_dynamic(
-        orig.connections,
-        source_type_hint=ConnectionDSL,
-        target_type_hint=ConnectionDATA,
-        orig_is_collection=True,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
-    retval.interface = orig.interface
-    retval.uid = orig.uid
-    return post_process(
-        orig,
-        retval,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
+    return None if orig is None else _convert_instrument_like(orig, SHFQADATA)
 
 
 def convert_SHFSG(orig: SHFSGDSL):
-    if orig is None:
-        return None
-    retval = SHFSGDATA()
-    retval.address = orig.address
-    retval.connections = convert_dynamic(
-        orig.connections,
-        source_type_hint=ConnectionDSL,
-        target_type_hint=ConnectionDATA,
-        orig_is_collection=True,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
-    retval.interface = orig.interface
-    retval.uid = orig.uid
-    return post_process(
-        orig,
-        retval,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
+    return None if orig is None else _convert_instrument_like(orig, SHFSGDATA)
 
 
+@_converter
 def convert_Server(orig: ServerDSL):
-    if orig is None:
-        return None
     retval = ServerDATA()
     retval.uid = orig.uid
-    return post_process(
-        orig,
-        retval,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
+    return retval
 
 
 def convert_UHFQA(orig: UHFQADSL):
-    if orig is None:
-        return None
-    retval = UHFQADATA()
-    retval.address = orig.address
-    retval.connections = convert_dynamic(
-        orig.connections,
-        source_type_hint=ConnectionDSL,
-        target_type_hint=ConnectionDATA,
-        orig_is_collection=True,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
-    retval.interface = orig.interface
-    retval.uid = orig.uid
-    return post_process(
-        orig,
-        retval,
-        conversion_function_lookup=get_converter_function_setup_description,
-    )
+    return None if orig is None else _convert_instrument_like(orig, UHFQADATA)
+
+
+# Built once at import - get_converter_function_setup_description is called
+# for every node of a converted DeviceSetup graph.
+_CONVERTER_TABLE = {
+    ConnectionDSL: convert_Connection,
+    DataServerDSL: convert_DataServer,
+    DeviceSetupDSL: convert_DeviceSetup,
+    HDAWGDSL: convert_HDAWG,
+    InstrumentDSL: convert_Instrument,
+    LogicalSignalDSL: convert_LogicalSignal,
+    LogicalSignalGroupDSL: convert_LogicalSignalGroup,
+    PQSCDSL: convert_PQSC,
+    PhysicalChannelDSL: convert_PhysicalChannel,
+    PortDSL: convert_Port,
+    QuantumElementDSL: convert_QuantumElement,
+    QubitDSL: convert_Qubit,
+    SHFQADSL: convert_SHFQA,
+    SHFSGDSL: convert_SHFSG,
+    ServerDSL: convert_Server,
+    UHFQADSL: convert_UHFQA,
+}
+
+# Bound dict lookup instead of a wrapper function - this is called for every
+# node of a converted setup graph.
+get_converter_function_setup_description = _CONVERTER_TABLE.get
+
+# convert_dynamic calls with their invariant keyword arguments pre-bound, so
+# the converters above only pass the object being converted.
+_convert_any = functools.partial(
+    convert_dynamic,
+    source_type_hint=AnyDSL,
+    target_type_hint=AnyDATA,
+    orig_is_collection=False,
+    conversion_function_lookup=get_converter_function_setup_description,
+)
+_convert_connections = functools.partial(
+    convert_dynamic,
+    source_type_hint=ConnectionDSL,
+    target_type_hint=ConnectionDATA,
+    orig_is_collection=True,
+    conversion_function_lookup=get_converter_function_setup_description,
+)
+_convert_instruments = functools.partial(
+    convert_dynamic,
+    source_type_hint=InstrumentDSL,
+    target_type_hint=InstrumentDATA,
+    orig_is_collection=True,
+    conversion_function_lookup=get_converter_function_setup_description,
+)
+_convert_logical_signal_groups = functools.partial(
+    convert_dynamic,
+    source_type_hint=LogicalSignalGroupDSL,
+    target_type_hint=LogicalSignalGroupDATA,
+    orig_is_collection=True,
+    conversion_function_lookup=get_converter_function_setup_description,
+)
+_convert_logical_signals = functools.partial(
+    convert_dynamic,
+    source_type_string="Dict",
+    target_type_string="Dict[str,LogicalSignal]",
+    orig_is_collection=True,
+    conversion_function_lookup=get_converter_function_setup_description,
+)
+_convert_servers = functools.partial(
+    convert_dynamic,
+    source_type_hint=DataServerDSL,
+    target_type_hint=ServerDATA,
+    orig_is_collection=True,
+    conversion_function_lookup=get_converter_function_setup_description,
+)
@@ -51,7 +51,80 @@ from laboneq.dsl.quantum import QuantumOperation, Qubit, QubitParameters
 from laboneq.dsl.result import Results
 from laboneq.dsl.session import Session
 from laboneq.dsl.utils import has_onboard_lo
-from laboneq.implementation.data_storage.l1q_database_wrapper import L1QDatabase
-from laboneq.openqasm3.openqasm3_importer import exp_from_qasm
-from laboneq.pulse_sheet_viewer.pulse_sheet_viewer import show_pulse_sheet
-from laboneq.simulator.output_simulator import OutputSimulator
+
+# Loaded lazily via the module __getattr__ (PEP 562) - these pull in large
+# import graphs (database, openqasm3, viewer, simulator) that most sessions
+# never touch.
+_LAZY_IMPORTS = {
+    "L1QDatabase": "laboneq.implementation.data_storage.l1q_database_wrapper",
+    "exp_from_qasm": "laboneq.openqasm3.openqasm3_importer",
+    "show_pulse_sheet": "laboneq.pulse_sheet_viewer.pulse_sheet_viewer",
+    "OutputSimulator": "laboneq.simulator.output_simulator",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return [*globals(), *_LAZY_IMPORTS]
+
+
+# Explicit __all__ so wildcard imports also resolve the lazy names.
+__all__ = [
+    "install_token",
+    "laboneq_logging",
+    "CompiledExperiment",
+    "LinearSweepParameter",
+    "SweepParameter",
+    "AmplifierPump",
+    "BounceCompensation",
+    "Calibratable",
+    "Calibration",
+    "ExponentialCompensation",
+    "FIRCompensation",
+    "HighPassCompensation",
+    "MixerCalibration",
+    "Oscillator",
+    "Precompensation",
+    "SignalCalibration",
+    "units",
+    "DeviceSetup",
+    "DeviceSetupHelper",
+    "AcquisitionType",
+    "AveragingMode",
+    "CarrierType",
+    "ExecutionType",
+    "HighPassCompensationClearing",
+    "ModulationType",
+    "PortMode",
+    "RepetitionMode",
+    "SectionAlignment",
+    "AcquireLoopNt",
+    "AcquireLoopRt",
+    "Case",
+    "Experiment",
+    "ExperimentSignal",
+    "Match",
+    "Section",
+    "Sweep",
+    "pulse_library",
+    "QuantumOperation",
+    "Qubit",
+    "QubitParameters",
+    "Results",
+    "Session",
+    "has_onboard_lo",
+    "L1QDatabase",
+    "exp_from_qasm",
+    "show_pulse_sheet",
+    "OutputSimulator",
+]
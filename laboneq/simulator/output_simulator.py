@@ -26,66 +26,55 @@ class OutputData:
 
 @dataclass
 class _AWG_ID:
+    # Manual __slots__, as dataclass(slots=True) requires Python 3.10+.
+    # OutputData cannot get the same treatment on 3.9 - its defaulted
+    # fields clash with manually declared slots.
+    __slots__ = ("is_out", "prog", "channels", "_sg_device_by_uid", "_dev_uid")
+
     is_out: bool
     prog: str
     channels: List[int]
 
     def __init__(
-        self, device_setup: DeviceSetup, ch: PhysicalChannel, realtime_inits: list
+        self, sg_device_by_uid: dict, ch: PhysicalChannel, seqc_by_awg: dict
     ):
-        self._device_setup = device_setup
-        [self._dev_uid, pch] = ch.uid.split("/")
-        ch_attrs = pch.split("_")
-        {
-            "sigouts": self._decode_sigouts,
-            "qas": self._decode_qas,
-            "qachannels": self._decode_qachannels,
-            "sgchannels": self._decode_sgchannels,
-        }[ch_attrs[0]](ch_attrs[1:], realtime_inits)
-
-    def find_seqc(self, device_name: str, awg_no: int, realtime_inits):
-        self.prog = next(
-            iter(
-                sorted(
-                    (
-                        rt_init
-                        for rt_init in realtime_inits
-                        if rt_init["awg_id"] == awg_no
-                        and rt_init["device_id"] == device_name
-                    ),
-                    key=lambda rt_init: rt_init["nt_step"]["indices"],
-                )
-            )
-        )["seqc_ref"]
+        self._sg_device_by_uid = sg_device_by_uid
+        self._dev_uid, _, pch = ch.uid.partition("/")
+        ch_type, _, ch_attrs = pch.partition("_")
+        _AWG_ID._DECODERS[ch_type](self, ch_attrs.split("_"), seqc_by_awg)
+
+    def find_seqc(self, device_name: str, awg_no: int, seqc_by_awg: dict):
+        self.prog = seqc_by_awg[(device_name, awg_no)]
 
-    def _decode_sigouts(self, chs: List[str], realtime_inits):
+    def _decode_sigouts(self, chs: List[str], seqc_by_awg):
         self.is_out = True
         self.channels = [int(ch) for ch in chs]
         awg_no = self.channels[0] // 2
-        self.find_seqc(self._dev_uid, awg_no, realtime_inits)
+        self.find_seqc(self._dev_uid, awg_no, seqc_by_awg)
 
-    def _decode_qas(self, chs: List[str], realtime_inits):
+    def _decode_qas(self, chs: List[str], seqc_by_awg):
         self.is_out = False
         self.channels = [int(ch) for ch in chs]
-        self.find_seqc(self._dev_uid, 0, realtime_inits)
+        self.find_seqc(self._dev_uid, 0, seqc_by_awg)
 
-    def _is_qc(self):
-        dev = self._device_setup.instrument_by_uid(self._dev_uid)
-        return dev.calc_driver() == "SHFQA" and dev.is_qc
-
-    def _decode_qachannels(self, chs: List[str], realtime_inits):
+    def _decode_qachannels(self, chs: List[str], seqc_by_awg):
         self.is_out = chs[1] == "output"
         self.channels = [0]
-        self.find_seqc(self._dev_uid, int(chs[0]), realtime_inits)
-
-    def _decode_sgchannels(self, chs: List[str], realtime_inits):
-        internal_device_name = (
-            self._dev_uid if not self._is_qc() else f"{self._dev_uid}_sg"
-        )
+        self.find_seqc(self._dev_uid, int(chs[0]), seqc_by_awg)
 
+    def _decode_sgchannels(self, chs: List[str], seqc_by_awg):
         self.is_out = True
         self.channels = [0, 1]
-        self.find_seqc(internal_device_name, int(chs[0]), realtime_inits)
+        self.find_seqc(self._sg_device_by_uid[self._dev_uid], int(chs[0]), seqc_by_awg)
+
+    # Built once at class creation - avoids allocating a fresh dispatch dict
+    # with four bound methods per construction.
+    _DECODERS = {
+        "sigouts": _decode_sigouts,
+        "qas": _decode_qas,
+        "qachannels": _decode_qachannels,
+        "sgchannels": _decode_sgchannels,
+    }
 
 
 class OutputSimulator:
@@ -137,9 +126,45 @@ class OutputSimulator:
     ) -> None:
         self._compiled_experiment = compiled_experiment
         self._max_output_length = max_output_length
+        # The compiled experiment is immutable - index the channels and
+        # resolve the recipe dict chain once instead of per get_snippet call.
+        self._channel_by_uid = {
+            ch.uid: ch
+            for g in compiled_experiment.device_setup.physical_channel_groups.values()
+            for ch in g.channels.values()
+        }
+        self._rt_inits = compiled_experiment.scheduled_experiment.recipe["experiment"][
+            "realtime_execution_init"
+        ]
+        # Per AWG, only the seqc of the first NT step is relevant - resolve it
+        # once here instead of filtering and sorting the full list per snippet.
+        seqc_by_awg: dict = {}
+        first_indices: dict = {}
+        for rt_init in self._rt_inits:
+            key = (rt_init["device_id"], rt_init["awg_id"])
+            indices = rt_init["nt_step"]["indices"]
+            if key not in first_indices or indices < first_indices[key]:
+                first_indices[key] = indices
+                seqc_by_awg[key] = rt_init["seqc_ref"]
+        self._seqc_by_awg = seqc_by_awg
+        # The internal device name for sg channels (uid, or "<uid>_sg" for
+        # the SG part of an SHFQC) cannot change after compilation - resolve
+        # it per device up front, including the name string itself.
+        self._sg_device_by_uid = {
+            inst.uid: f"{inst.uid}_sg"
+            if inst.calc_driver() == "SHFQA" and inst.is_qc
+            else inst.uid
+            for inst in compiled_experiment.device_setup.instruments
+        }
         self._simulations = simulate(
             compiled_experiment, max_time=max_simulation_length
         )
+        # WaveScrollers keyed by (channel uid, sim targets) - their inputs
+        # are immutable for the lifetime of the simulator, so repeated
+        # get_snippet calls for the same channel can reuse them.
+        self._wave_scrollers: dict = {}
+        # Same reasoning for the decoded AWG ids, keyed by channel uid alone.
+        self._awg_id_by_channel_uid: dict = {}
 
     @property
     def max_output_length(self) -> float:
@@ -150,12 +175,10 @@ class OutputSimulator:
         self._max_output_length = max_output_length
 
     def _uid_to_channel(self, uid: str) -> PhysicalChannel:
-        pcg = self._compiled_experiment.device_setup.physical_channel_groups
-        for g in pcg.values():
-            for ch in g.channels.values():
-                if ch.uid == uid:
-                    return ch
-        raise RuntimeError(f"Can't find physical channel with uid '{uid}'")
+        channel = self._channel_by_uid.get(uid)
+        if channel is None:
+            raise RuntimeError(f"Can't find physical channel with uid '{uid}'")
+        return channel
 
     def get_snippet(
         self,
@@ -172,35 +195,43 @@ class OutputSimulator:
             if isinstance(physical_channel, PhysicalChannel)
             else self._uid_to_channel(physical_channel)
         )
-        awg_id = _AWG_ID(
-            self._compiled_experiment.device_setup,
-            channel,
-            self._compiled_experiment.scheduled_experiment.recipe["experiment"][
-                "realtime_execution_init"
-            ],
-        )
+        awg_id = self._awg_id_by_channel_uid.get(channel.uid)
+        if awg_id is None:
+            awg_id = _AWG_ID(
+                self._sg_device_by_uid,
+                channel,
+                self._seqc_by_awg,
+            )
+            self._awg_id_by_channel_uid[channel.uid] = awg_id
 
         sim = self._simulations[awg_id.prog]
+        is_out = awg_id.is_out
         sim_targets = SimTarget.NONE
-        if get_wave and awg_id.is_out:
+        if get_wave and is_out:
             sim_targets |= SimTarget.PLAY
-        if get_wave and not awg_id.is_out:
+        if get_wave and not is_out:
             sim_targets |= SimTarget.ACQUIRE
-        if get_trigger and awg_id.is_out:
+        if get_trigger and is_out:
             sim_targets |= SimTarget.TRIGGER
-        if get_marker and awg_id.is_out:
+        if get_marker and is_out:
             sim_targets |= SimTarget.MARKER
-        if get_frequency and awg_id.is_out:
+        if get_frequency and is_out:
             sim_targets |= SimTarget.FREQUENCY
-        ws = WaveScroller(
-            ch=awg_id.channels,
-            sim_targets=sim_targets,
-            sim=sim,
-        )
+        cache_key = (channel.uid, sim_targets)
+        ws = self._wave_scrollers.get(cache_key)
+        if ws is None:
+            ws = WaveScroller(
+                ch=awg_id.channels,
+                sim_targets=sim_targets,
+                sim=sim,
+            )
+            self._wave_scrollers[cache_key] = ws
+        else:
+            ws.reset()
         ws.calc_snippet(start, output_length)
         return OutputData(
             time=ws.time_axis,
-            wave=ws.wave_snippet if awg_id.is_out else ws.acquire_snippet,
+            wave=ws.wave_snippet if is_out else ws.acquire_snippet,
             marker=ws.marker_snippet,
             trigger=ws.trigger_snippet,
             frequency=ws.frequency_snippet,
@@ -153,6 +153,20 @@ class WaveScroller:
 
         self.sim_targets = sim_targets
 
+        self.reset()
+
+        self.processors = {
+            Operation.PLAY_WAVE: self._process_play_wave,
+            Operation.PLAY_HOLD: self._process_play_hold,
+            Operation.PLAY_ZERO: self._process_play_zero,
+            Operation.START_QA: self._process_start_qa,
+            Operation.SET_TRIGGER: self._process_set_trigger,
+            Operation.SET_OSC_FREQ: self._process_set_osc_freq,
+        }
+
+    def reset(self):
+        """Clear the per-snippet state, making the scroller reusable for
+        another calc_snippet() call."""
         self.wave_snippet = None
         self.marker_snippet = None
         self.acquire_snippet = None
@@ -167,15 +181,6 @@ class WaveScroller:
         self.last_played_value = 0
         self.oscillator_phase: Optional[float] = None
 
-        self.processors = {
-            Operation.PLAY_WAVE: self._process_play_wave,
-            Operation.PLAY_HOLD: self._process_play_hold,
-            Operation.PLAY_ZERO: self._process_play_zero,
-            Operation.START_QA: self._process_start_qa,
-            Operation.SET_TRIGGER: self._process_set_trigger,
-            Operation.SET_OSC_FREQ: self._process_set_osc_freq,
-        }
-
     def is_output(self) -> bool:
         return any(
             t in self.sim_targets